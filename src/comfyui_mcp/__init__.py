@@ -3,32 +3,124 @@ ComfyUI MCP Server - AI-powered image generation for Godot games.
 
 This package provides a Model Context Protocol (MCP) server that bridges
 ComfyUI's workflow-based image generation with Godot game development.
+
+Public names are resolved lazily (PEP 562): ``import comfyui_mcp`` only
+defines ``__version__``, and the client, server, CLI and model modules are
+imported the first time one of their names is accessed.
 """
 
 from __future__ import annotations
 
-# Define version first to avoid circular import with cli.py
-__version__ = "0.1.0"
-
-from comfyui_mcp.cli import cli
-from comfyui_mcp.cli import main as cli_main
-from comfyui_mcp.comfyui_client import ComfyUIClient
-from comfyui_mcp.config import find_config_file, load_config
-from comfyui_mcp.image_generator import ImageGenerator
-from comfyui_mcp.models import (
-    ComfyUIConfig,
-    GenerationRequest,
-    GenerationResult,
-    TemplateParameter,
-    WorkflowNode,
-    WorkflowPrompt,
-    WorkflowState,
-    WorkflowStatus,
-    WorkflowTemplate,
-)
-from comfyui_mcp.retry import retry_with_backoff
-from comfyui_mcp.server import ComfyUIMCPServer
-from comfyui_mcp.template_manager import WorkflowTemplateManager
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from comfyui_mcp._version import __version__
+
+if TYPE_CHECKING:
+    import click
+
+    from comfyui_mcp.cli import cli
+    from comfyui_mcp.cli import main as cli_main
+    from comfyui_mcp.comfyui_client import ComfyUIClient
+    from comfyui_mcp.config import find_config_file, load_config
+    from comfyui_mcp.image_generator import ImageGenerator
+    from comfyui_mcp.models import (
+        ComfyUIConfig,
+        GenerationRequest,
+        GenerationResult,
+        TemplateParameter,
+        WorkflowNode,
+        WorkflowPrompt,
+        WorkflowState,
+        WorkflowStatus,
+        WorkflowTemplate,
+    )
+    from comfyui_mcp.retry import retry_with_backoff
+    from comfyui_mcp.server import ComfyUIMCPServer
+    from comfyui_mcp.template_manager import WorkflowTemplateManager
+
+# Maps each lazily exported name to (module, attribute)
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "cli_main": ("comfyui_mcp.cli", "main"),
+    "ComfyUIClient": ("comfyui_mcp.comfyui_client", "ComfyUIClient"),
+    "ComfyUIMCPServer": ("comfyui_mcp.server", "ComfyUIMCPServer"),
+    "ImageGenerator": ("comfyui_mcp.image_generator", "ImageGenerator"),
+    "WorkflowNode": ("comfyui_mcp.models", "WorkflowNode"),
+    "WorkflowPrompt": ("comfyui_mcp.models", "WorkflowPrompt"),
+    "GenerationResult": ("comfyui_mcp.models", "GenerationResult"),
+    "GenerationRequest": ("comfyui_mcp.models", "GenerationRequest"),
+    "ComfyUIConfig": ("comfyui_mcp.models", "ComfyUIConfig"),
+    "WorkflowState": ("comfyui_mcp.models", "WorkflowState"),
+    "WorkflowStatus": ("comfyui_mcp.models", "WorkflowStatus"),
+    "TemplateParameter": ("comfyui_mcp.models", "TemplateParameter"),
+    "WorkflowTemplate": ("comfyui_mcp.models", "WorkflowTemplate"),
+    "WorkflowTemplateManager": (
+        "comfyui_mcp.template_manager",
+        "WorkflowTemplateManager",
+    ),
+    "retry_with_backoff": ("comfyui_mcp.retry", "retry_with_backoff"),
+    "find_config_file": ("comfyui_mcp.config", "find_config_file"),
+    "load_config": ("comfyui_mcp.config", "load_config"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access and cache it in the module globals.
+
+    Args:
+        name: Attribute being looked up on the package
+
+    Returns:
+        The requested object from its defining submodule
+
+    Raises:
+        AttributeError: If name is not a public export of the package
+    """
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+class _Package(ModuleType):
+    """Module type of the package, keeping ``cli`` bound to the Click group.
+
+    ``cli`` names both a public export (the Click group) and a submodule.
+    Loading the submodule makes the import system set the package attribute
+    ``cli`` to the module, so without this property the export would depend
+    on what was imported first. A data descriptor on the module's type takes
+    precedence over that binding.
+    """
+
+    @property
+    def cli(self) -> click.Group:
+        """The ``comfyui-mcp`` Click group, imported on first access."""
+        value = vars(self).get("cli")
+        if value is None or isinstance(value, ModuleType):
+            value = importlib.import_module("comfyui_mcp.cli").cli
+        return value  # type: ignore[no-any-return]
+
+    @cli.setter
+    def cli(self, value: Any) -> None:
+        # Stored for explicit assignments (e.g. monkeypatching); the binding
+        # of the submodule itself is ignored by the getter
+        vars(self)["cli"] = value
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __dir__() -> list[str]:
+    """List the public names of the package, including lazy exports."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "__version__",
@@ -0,0 +1,69 @@
+"""Console entry point for the comfyui-mcp CLI.
+
+This module is the target of the ``comfyui-mcp`` console script (and of
+``python -m comfyui_mcp``). It answers ``--version`` straight from
+``comfyui_mcp._version`` and a bare ``--help`` from the pre-rendered
+``_help_cache.txt``, without importing Click or any of the package's
+submodules, and hands every other invocation to :func:`comfyui_mcp.cli.main`.
+
+Example:
+    >>> # Fast paths: no Click, aiohttp or pydantic import
+    >>> comfyui-mcp --version
+    comfyui-mcp, version 0.1.0
+    >>> comfyui-mcp --help
+    Usage: comfyui-mcp [OPTIONS] COMMAND [ARGS]...
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+# Mirrors comfyui_mcp.cli.HELP_CACHE_FILENAME (not imported to stay Click-free)
+_HELP_CACHE_PATH = os.path.join(os.path.dirname(__file__), "_help_cache.txt")
+
+# Click wraps help to the terminal width, capped at 80 columns; narrower
+# terminals get a different layout than the pre-rendered text
+_HELP_CACHE_MIN_COLUMNS = 80
+
+
+def _cached_help() -> str | None:
+    """Return the pre-rendered top-level help if it matches this terminal.
+
+    Returns:
+        The help text, or None when the terminal is narrower than the
+        rendered layout or the file is missing
+    """
+    import shutil
+
+    if shutil.get_terminal_size().columns < _HELP_CACHE_MIN_COLUMNS:
+        return None
+    try:
+        with open(_HELP_CACHE_PATH, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def main() -> None:
+    """Run the CLI, short-circuiting ``--version`` and ``--help`` first."""
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        from comfyui_mcp._version import __version__
+
+        sys.stdout.write(f"comfyui-mcp, version {__version__}\n")
+        sys.exit(0)
+
+    if argv == ["--help"]:
+        help_text = _cached_help()
+        if help_text is not None:
+            sys.stdout.write(help_text)
+            sys.exit(0)
+
+    from comfyui_mcp.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
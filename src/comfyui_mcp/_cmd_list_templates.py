@@ -0,0 +1,156 @@
+"""The ``list-templates`` subcommand.
+
+Lists the workflow templates in the template directory as plain text,
+detailed text or JSON.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+
+from comfyui_mcp._console import echo_traceback
+from comfyui_mcp._help import LIST_TEMPLATES_HELP
+
+
+@click.command("list-templates", help=LIST_TEMPLATES_HELP)
+@click.option(
+    "--detailed",
+    is_flag=True,
+    help="Show detailed template information (name, description, category)",
+)
+@click.option(
+    "--category",
+    type=str,
+    help="Filter templates by category",
+)
+@click.option(
+    "--json",
+    "json_output",
+    is_flag=True,
+    help="Output results as JSON",
+)
+@click.pass_context
+def list_templates(
+    ctx: click.Context,
+    detailed: bool,
+    category: str | None,
+    json_output: bool,
+) -> None:
+    """List available workflow templates."""
+    from comfyui_mcp import _json
+    from comfyui_mcp.config import get_cache_dir
+    from comfyui_mcp.template_manager import WorkflowTemplateManager
+
+    verbose: bool = ctx.obj.get("verbose", False)
+    template_dir: Path | None = ctx.obj.get("template_dir")
+
+    # Use default template directory if not specified
+    if template_dir is None:
+        template_dir = Path("workflows")
+
+    # Check if template directory exists
+    if not template_dir.exists():
+        if verbose:
+            click.echo(
+                f"Template directory not found: {template_dir}",
+                err=True,
+            )
+        click.echo("No templates found.", err=True)
+        return
+
+    try:
+        # Initialize template manager; summaries are served from an on-disk
+        # index so listings don't re-parse unchanged template files
+        manager = WorkflowTemplateManager(template_dir, cache_dir=get_cache_dir())
+
+        # Get templates (filtered by category if specified)
+        if category:
+            template_ids = [
+                summary.template_id
+                for summary in manager.get_template_summaries()
+                if summary.category == category
+            ]
+        else:
+            template_ids = manager.list_templates()
+
+        # Handle empty results
+        if not template_ids:
+            if json_output:
+                click.echo("[]")
+            else:
+                if category:
+                    click.echo(f"No templates found in category: {category}")
+                else:
+                    click.echo("No templates found.")
+            return
+
+        # JSON output
+        if json_output:
+            if detailed:
+                # Load full template data for JSON output
+                templates_data = []
+                for template_id in template_ids:
+                    template = manager.load_template(template_id)
+                    templates_data.append(
+                        {
+                            "id": template_id,
+                            "name": template.name,
+                            "description": template.description,
+                            "category": template.category,
+                            "parameters": {
+                                name: {
+                                    "type": param.type,
+                                    "description": param.description,
+                                    "default": param.default,
+                                }
+                                for name, param in template.parameters.items()
+                            },
+                        }
+                    )
+                click.echo(_json.dumps(templates_data, indent=True))
+            else:
+                # Simple JSON list of IDs
+                click.echo(_json.dumps(template_ids))
+            return
+
+        # Detailed output
+        if detailed:
+            summaries = {
+                summary.template_id: summary
+                for summary in manager.get_template_summaries()
+            }
+            click.echo(f"\nFound {len(template_ids)} template(s):\n")
+            for template_id in template_ids:
+                summary = summaries[template_id]
+                click.echo(f"ID:          {template_id}")
+                click.echo(f"Name:        {summary.name}")
+                click.echo(f"Description: {summary.description}")
+                click.echo(f"Category:    {summary.category or 'None'}")
+                if summary.parameter_count:
+                    click.echo(f"Parameters:  {summary.parameter_count}")
+                click.echo()
+        else:
+            # Simple list output
+            click.echo(f"\nAvailable templates ({len(template_ids)}):\n")
+            for template_id in template_ids:
+                click.echo(f"  • {template_id}")
+            click.echo()
+
+    except Exception as e:
+        # Handle errors
+        click.echo(
+            click.style(f"Error listing templates: {e}", fg="red"),
+            err=True,
+        )
+        if verbose:
+            echo_traceback()
+        sys.exit(1)
+
+
+# Entry looked up by comfyui_mcp.cli.LazyGroup
+cmd = list_templates
+
+__all__ = ["cmd", "list_templates"]
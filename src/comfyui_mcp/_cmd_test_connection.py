@@ -0,0 +1,88 @@
+"""The ``test-connection`` subcommand.
+
+Checks that the configured ComfyUI server is reachable and reports the
+result of its health check.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import click
+
+from comfyui_mcp._console import echo_traceback
+from comfyui_mcp._help import TEST_CONNECTION_HELP
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+    from comfyui_mcp.models import ComfyUIConfig
+
+
+@click.command("test-connection", help=TEST_CONNECTION_HELP)
+@click.pass_context
+def test_connection(ctx: click.Context) -> None:
+    """Test connection to the ComfyUI server."""
+    # Imported here so other subcommands don't pay for aiohttp
+    import asyncio
+
+    from comfyui_mcp.comfyui_client import ComfyUIClient
+
+    config: ComfyUIConfig = ctx.obj["config"]
+    verbose: bool = ctx.obj.get("verbose", False)
+
+    # Show which URL we're testing
+    click.echo(f"Testing connection to ComfyUI server at: {config.url}")
+
+    async def _test_connection() -> Mapping[str, Any]:
+        """Inner async function to perform the health check."""
+        async with ComfyUIClient(config) as client:
+            return await client.health_check()
+
+    # Run the async health check
+    try:
+        result = asyncio.run(_test_connection())
+
+        # Check if connection was successful
+        if result.get("connected", False):
+            click.echo(click.style("✓ Connection successful!", fg="green"))
+
+            # Show additional details in verbose mode
+            if verbose:
+                click.echo(f"  URL: {result.get('url', 'N/A')}")
+                if "status_code" in result:
+                    click.echo(f"  Status: {result['status_code']}")
+                if "response_time" in result:
+                    click.echo(f"  Response time: {result['response_time']:.3f}s")
+
+            sys.exit(0)
+        else:
+            # Connection failed
+            click.echo(click.style("✗ Connection failed", fg="red"), err=True)
+
+            # Show error details
+            error_msg = result.get("error", "Unknown error")
+            click.echo(f"  Error: {error_msg}", err=True)
+
+            if verbose and "url" in result:
+                click.echo(f"  Attempted URL: {result['url']}", err=True)
+
+            sys.exit(1)
+
+    except Exception as e:
+        # Handle unexpected errors
+        click.echo(
+            click.style(f"✗ Error testing connection: {e}", fg="red"),
+            err=True,
+        )
+        if verbose:
+            echo_traceback()
+        sys.exit(1)
+
+
+# Entry looked up by comfyui_mcp.cli.LazyGroup
+cmd = test_connection
+
+__all__ = ["cmd", "test_connection"]
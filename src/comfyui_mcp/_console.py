@@ -0,0 +1,25 @@
+"""Output helpers shared by the comfyui-mcp subcommands."""
+
+from __future__ import annotations
+
+import click
+
+
+def echo_traceback() -> None:
+    """Write the traceback of the exception being handled to stderr.
+
+    ``traceback`` is imported here rather than by the commands, so it is
+    only loaded when a verbose run actually fails.
+
+    Example:
+        >>> try:
+        ...     raise RuntimeError("boom")
+        ... except RuntimeError:
+        ...     echo_traceback()
+    """
+    import traceback
+
+    click.echo(traceback.format_exc(), err=True)
+
+
+__all__ = ["echo_traceback"]
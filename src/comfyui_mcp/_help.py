@@ -0,0 +1,128 @@
+"""Help text for the comfyui-mcp command line.
+
+Click builds ``--help`` output from a command's docstring by default, and
+``python -OO`` strips docstrings. Keeping the text here and passing it as
+``help=`` keeps the help output intact in optimized mode, and the command
+functions themselves stay short.
+"""
+
+from __future__ import annotations
+
+CLI_HELP = """\
+ComfyUI MCP Server - AI-powered image generation for Godot games.
+
+This CLI provides commands for interacting with ComfyUI through the
+Model Context Protocol (MCP) server. It enables workflow-based image
+generation, template management, and server operations.
+
+Configuration Priority (highest to lowest):
+1. Command-line arguments (--comfyui-url, --template-dir)
+2. Environment variables (COMFYUI_URL, COMFYUI_OUTPUT_DIR)
+3. Configuration file (--config or auto-discovered)
+4. Default values
+
+Examples:
+    # Show available commands
+    comfyui --help
+
+    # Use custom configuration file
+    comfyui --config myconfig.toml list-templates
+
+    # Override ComfyUI server URL
+    comfyui --comfyui-url http://localhost:9999 generate
+
+For more information, visit: https://github.com/purlieu-studios/comfyui-mcp
+"""
+
+TEST_CONNECTION_HELP = """\
+Test connection to the ComfyUI server.
+
+This command attempts to connect to the configured ComfyUI server
+and reports whether the connection was successful. It performs a
+health check on the server's API endpoint.
+
+The command uses the configuration from:
+1. --comfyui-url command-line option (highest priority)
+2. COMFYUI_URL environment variable
+3. Configuration file
+4. Default (http://localhost:8188)
+
+Exit codes:
+    0: Connection successful
+    1: Connection failed
+
+Examples:
+    # Test connection using default or configured URL
+    comfyui test-connection
+
+    # Test connection to a specific URL
+    comfyui --comfyui-url http://192.168.1.100:8188 test-connection
+
+    # Show verbose output
+    comfyui --verbose test-connection
+"""
+
+GENERATE_HELP = """\
+Generate images using a workflow template.
+
+This command generates images by instantiating a workflow template with
+the provided parameters and submitting it to ComfyUI for execution.
+
+The TEMPLATE_ID argument specifies which template to use (filename without
+the .json extension).
+
+Parameters can be provided using the --param option with key=value pairs.
+Parameters can be specified multiple times for different values.
+
+Examples:
+    # Generate with default parameters
+    comfyui generate character-portrait
+
+    # Generate with custom parameters
+    comfyui generate character-portrait --param prompt="a wizard" --param seed=42
+
+    # Generate with custom output directory
+    comfyui generate item-icon --param item="sword" --output ./generated
+
+    # Use verbose mode for detailed information
+    comfyui --verbose generate environment-texture --param style="fantasy"
+"""
+
+LIST_TEMPLATES_HELP = """\
+List available workflow templates.
+
+This command displays all workflow templates available in the configured
+template directory. Templates can be filtered by category and displayed
+in different formats.
+
+The command uses the template directory from:
+1. --template-dir command-line option (highest priority)
+2. Configuration file
+3. Default (./workflows)
+
+Output Formats:
+    Default: Simple list of template IDs
+    --detailed: Shows template name, description, and category
+    --json: Outputs machine-readable JSON format
+
+Examples:
+    # List all templates
+    comfyui list-templates
+
+    # Show detailed information
+    comfyui list-templates --detailed
+
+    # Filter by category
+    comfyui list-templates --category character
+
+    # Get JSON output for scripting
+    comfyui list-templates --json
+"""
+
+
+__all__ = [
+    "CLI_HELP",
+    "GENERATE_HELP",
+    "LIST_TEMPLATES_HELP",
+    "TEST_CONNECTION_HELP",
+]
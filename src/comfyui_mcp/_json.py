@@ -0,0 +1,90 @@
+"""JSON encoding and decoding with an optional fast backend.
+
+Uses orjson when it is installed (``pip install comfyui-mcp[fast]``) and
+falls back to the standard library otherwise. Both backends produce the
+same data; compact output uses no whitespace in either case.
+
+Example:
+    >>> from comfyui_mcp import _json
+    >>> _json.loads(b'{"a": 1}')
+    {'a': 1}
+    >>> _json.dumps(["a", "b"])
+    '["a","b"]'
+    >>> _json.dumps_bytes({"a": 1})
+    b'{"a":1}'
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error type
+                              is a subclass of it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize an object to JSON text.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation. Defaults to compact
+                output.
+
+    Returns:
+        JSON text
+
+    Raises:
+        TypeError: If obj contains values that cannot be serialized
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Suited to HTTP request bodies and files opened in binary mode: with
+    orjson the bytes are produced directly, without an intermediate str.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation. Defaults to compact
+                output.
+
+    Returns:
+        JSON document as UTF-8 bytes
+
+    Raises:
+        TypeError: If obj contains values that cannot be serialized
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return dumps(obj, indent=indent).encode()
+
+
+__all__ = ["dumps", "dumps_bytes", "loads"]
@@ -0,0 +1,5 @@
+"""Package version, kept in a dependency-free module for cheap access."""
+
+from __future__ import annotations
+
+__version__ = "0.1.0"
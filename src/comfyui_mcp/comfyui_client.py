@@ -6,11 +6,19 @@ managing aiohttp sessions, connection pooling, and providing proper resource cle
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+import os
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
 
 import aiohttp
 
+from comfyui_mcp import _json
+from comfyui_mcp._version import __version__
 from comfyui_mcp.models import (
     ComfyUIConfig,
     GenerationResult,
@@ -21,8 +29,222 @@ from comfyui_mcp.models import (
 from comfyui_mcp.retry import retry_with_backoff
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterable
     from types import TracebackType
 
+    from yarl import URL
+
+# Bytes read per iteration when streaming an image to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Headers sent with every request of a client session
+_DEFAULT_HEADERS = {"User-Agent": f"comfyui-mcp/{__version__}"}
+
+# Body of a /history/{prompt_id} response for a prompt without history
+_EMPTY_HISTORY = b"{}"
+
+# Headers for request bodies serialized ahead of time with _json.dumps_bytes
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Whether this interpreter leaks aborted SSL transports without aiohttp's
+# enable_cleanup_closed workaround. aiohttp warns when the flag is passed on
+# fixed Pythons; releases before the constant existed always need it.
+_NEEDS_CLEANUP_CLOSED: bool = getattr(aiohttp.connector, "NEEDS_CLEANUP_CLOSED", True)
+
+
+class _HealthCheckFields(TypedDict):
+    """Keys present in every health_check() result."""
+
+    connected: bool
+    url: str
+
+
+class HealthCheckResult(_HealthCheckFields, total=False):
+    """Result of ComfyUIClient.health_check().
+
+    A plain dict at runtime; ``status_code`` is present when the server
+    answered and ``error`` when it could not be reached.
+    """
+
+    status_code: int
+    error: str
+
+
+@lru_cache(maxsize=8)
+def _timeout_for(total: float) -> aiohttp.ClientTimeout:
+    """Return the (immutable) session timeout for a total timeout in seconds.
+
+    Args:
+        total: Total request timeout in seconds
+
+    Returns:
+        A ClientTimeout shared by every session with the same timeout
+    """
+    return aiohttp.ClientTimeout(total=total)
+
+
+def _queue_item_id(item: list[Any]) -> Any:
+    """Return the prompt ID of one /queue entry.
+
+    ComfyUI lists queue entries as ``[number, prompt_id, prompt, ...]``.
+    Entries that do not start with a number are taken to lead with the ID.
+
+    Args:
+        item: Non-empty entry of queue_running or queue_pending
+
+    Returns:
+        The entry's prompt ID
+    """
+    if isinstance(item[0], int) and len(item) > 1:
+        return item[1]
+    return item[0]
+
+
+def _index_queue(queue_data: dict[str, Any]) -> tuple[set[Any], dict[Any, int]]:
+    """Index a /queue response by prompt ID for constant-time lookups.
+
+    Args:
+        queue_data: Decoded /queue response
+
+    Returns:
+        Tuple of (IDs of running prompts, pending prompt ID -> queue position)
+    """
+    queue_running: list[list[Any]] = queue_data.get("queue_running", [])
+    queue_pending: list[list[Any]] = queue_data.get("queue_pending", [])
+
+    running_ids = {_queue_item_id(item) for item in queue_running if item}
+    pending_index: dict[Any, int] = {}
+    for index, item in enumerate(queue_pending):
+        if item:
+            # Keep the first position if an ID appears more than once
+            pending_index.setdefault(_queue_item_id(item), index)
+
+    return running_ids, pending_index
+
+
+def _status_from_index(
+    prompt_id: str, queue_index: tuple[set[Any], dict[Any, int]]
+) -> WorkflowStatus:
+    """Resolve a prompt's status from an index built by _index_queue().
+
+    Args:
+        prompt_id: Prompt ID to look up
+        queue_index: Result of _index_queue()
+
+    Returns:
+        RUNNING or QUEUED status if the prompt is in the queue, COMPLETED
+        otherwise
+    """
+    running_ids, pending_index = queue_index
+
+    # Check if prompt is currently running
+    if prompt_id in running_ids:
+        return WorkflowStatus(
+            state=WorkflowState.RUNNING,
+            queue_position=None,
+            progress=0.0,
+        )
+
+    # Check if prompt is in pending queue
+    position = pending_index.get(prompt_id)
+    if position is not None:
+        return WorkflowStatus(
+            state=WorkflowState.QUEUED,
+            queue_position=position,
+            progress=0.0,
+        )
+
+    # If not found in either queue, assume it's completed
+    return WorkflowStatus(
+        state=WorkflowState.COMPLETED,
+        queue_position=None,
+        progress=1.0,
+    )
+
+
+def _result_from_history(
+    prompt_id: str, prompt_history: dict[str, Any]
+) -> GenerationResult | None:
+    """Build a GenerationResult from one prompt's /history entry.
+
+    Args:
+        prompt_id: Prompt ID the entry belongs to
+        prompt_history: The prompt's entry from a /history response
+
+    Returns:
+        GenerationResult listing the generated images, or None if the entry
+        has no outputs yet
+    """
+    # Extract outputs
+    outputs: dict[str, Any] = prompt_history.get("outputs", {})
+    if not outputs:
+        return None
+
+    # Collect all images from all output nodes, skipping entries without a
+    # filename before any path is formatted
+    image_paths: list[str] = [
+        f"{subfolder}/{filename}" if subfolder else filename
+        for node_output in outputs.values()
+        for image_info in node_output.get("images", ())
+        if (filename := image_info.get("filename"))
+        for subfolder in (image_info.get("subfolder"),)
+    ]
+
+    # Create and return GenerationResult
+    return GenerationResult(
+        images=image_paths,
+        execution_time=0.0,  # TODO: Extract from history if available
+        metadata={},  # TODO: Extract workflow metadata if needed
+        prompt_id=prompt_id,
+        seed=None,  # TODO: Extract seed from workflow if needed
+    )
+
+
+class _SharedPools:
+    """Sessions and connection pools shared by clients on one event loop."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[tuple[Any, ...], aiohttp.ClientSession] = {}
+        self.connectors: dict[tuple[Any, ...], aiohttp.TCPConnector] = {}
+        # Strong reference to the loop shutdown hook; event loops only track
+        # async generators weakly
+        self.shutdown_hook: AsyncGenerator[None, None] | None = None
+
+    async def close(self) -> None:
+        """Close every session, then every connection pool."""
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        connectors = list(self.connectors.values())
+        self.connectors.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        for connector in connectors:
+            if not connector.closed:
+                await connector.close()
+
+
+async def _close_at_loop_shutdown(
+    loop: asyncio.AbstractEventLoop, pools: _SharedPools
+) -> AsyncGenerator[None, None]:
+    """Close a loop's shared pools when the loop shuts down.
+
+    The generator is advanced to its ``yield`` and left suspended. asyncio.run()
+    (like other loop runners) calls loop.shutdown_asyncgens() before closing
+    the loop, which closes the generator while the loop can still run the
+    cleanup in ``finally``.
+
+    Args:
+        loop: Event loop the pools belong to
+        pools: Pools to close
+    """
+    try:
+        yield
+    finally:
+        if ComfyUIClient._shared_pools.get(loop) is pools:
+            del ComfyUIClient._shared_pools[loop]
+        await pools.close()
+
 
 class ComfyUIClient:
     """Async HTTP client for ComfyUI API with aiohttp session management.
@@ -54,6 +276,13 @@ class ComfyUIClient:
         ...     await client.close()
     """
 
+    #: Sessions and connection pools shared by clients whose config sets
+    #: share_session=True, per event loop. A loop's entry is closed and
+    #: removed when the loop shuts down (or by close_all()).
+    _shared_pools: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedPools]
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(self, config: ComfyUIConfig) -> None:
         """Initialize the ComfyUI client with configuration.
 
@@ -72,6 +301,28 @@ class ComfyUIClient:
         self.config = config
         self._session: aiohttp.ClientSession | None = None
 
+        # Endpoint URLs are fixed for the client's lifetime (config is frozen).
+        # They are joined onto the config's pre-parsed yarl URL, which aiohttp
+        # uses as-is instead of parsing a URL string on every request.
+        self._base_url = config.url.rstrip("/")
+        base = config.base_url
+        self._queue_url = base / "queue"
+        self._prompt_url = base / "prompt"
+        self._history_url = base / "history"
+        self._view_url = base / "view"
+        self._interrupt_url = base / "interrupt"
+
+        # Static headers sent with every request of the client's sessions,
+        # formatted once and read-only so later sessions reuse them unchanged
+        headers = dict(_DEFAULT_HEADERS)
+        if config.api_key is not None:
+            headers["Authorization"] = f"Bearer {config.api_key}"
+        self._headers = MappingProxyType(headers)
+
+        # Last /queue document and its ETag, for conditional polling
+        self._queue_etag: str | None = None
+        self._queue_data: dict[str, Any] | None = None
+
         # Initialize logger
         self.logger = logging.getLogger(__name__)
 
@@ -87,7 +338,12 @@ class ComfyUIClient:
 
         This property uses lazy initialization - the session is created on first
         access. The session is configured with the timeout and headers (including
-        Authorization if an API key is provided) from the client's config.
+        Authorization if an API key is provided) from the client's config, and
+        uses a TCPConnector sized by the config's connection_limit,
+        per_host_limit and keepalive_timeout so concurrent submit, poll and
+        download requests reuse pooled keep-alive connections. Responses with
+        4xx/5xx statuses raise aiohttp.ClientResponseError unless a request
+        passes ``raise_for_status=False``.
 
         Returns:
             The aiohttp ClientSession instance for making HTTP requests.
@@ -97,29 +353,165 @@ class ComfyUIClient:
             >>> session = client.session  # Session created on first access
             >>> session2 = client.session  # Same session instance reused
             >>> assert session is session2
+
+            Clients created with ``share_session=True`` reuse one session
+            (and its connection pool) per server configuration:
+            >>> shared = ComfyUIConfig(url="http://127.0.0.1:8188", share_session=True)
+            >>> assert ComfyUIClient(shared).session is ComfyUIClient(shared).session
         """
-        if self._session is None:
-            self.logger.debug("Creating aiohttp session")
+        # The check and the creation below never await, so coroutines on the
+        # event loop cannot interleave here and no lock is needed
+        if self._session is None or (
+            self.config.share_session and self._session.closed
+        ):
+            if self.config.share_session:
+                self._session = self._shared_session()
+            else:
+                self._session = self._create_session()
 
-            # Create timeout configuration
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        return self._session
 
-            # Create headers with optional API key
-            headers: dict[str, str] = {}
-            if self.config.api_key is not None:
-                headers["Authorization"] = f"Bearer {self.config.api_key}"
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Create a TCPConnector sized by the client's config.
 
-            # Create session with configuration
-            self._session = aiohttp.ClientSession(timeout=timeout, headers=headers)
+        Returns:
+            A new connection pool for the client's sessions
+        """
+        # Pool connections explicitly; aiohttp's default caps at 100
+        return aiohttp.TCPConnector(
+            limit=self.config.connection_limit,
+            limit_per_host=self.config.per_host_limit,
+            keepalive_timeout=self.config.keepalive_timeout,
+            enable_cleanup_closed=_NEEDS_CLEANUP_CLOSED,
+            force_close=False,
+            ttl_dns_cache=300,
+        )
 
-        return self._session
+    def _create_session(
+        self, connector: aiohttp.TCPConnector | None = None
+    ) -> aiohttp.ClientSession:
+        """Create an aiohttp ClientSession configured from the client's config.
+
+        Args:
+            connector: Shared connection pool to use. The session does not own
+                it, so closing the session leaves the pool open. A private
+                pool is created when omitted.
+
+        Returns:
+            A new ClientSession with the configured timeout, headers and
+            connection pool
+        """
+        self.logger.debug("Creating aiohttp session")
+
+        # Create session with configuration; HTTP errors (4xx, 5xx) raise
+        # ClientResponseError as soon as a response arrives
+        return aiohttp.ClientSession(
+            connector=connector or self._create_connector(),
+            connector_owner=connector is None,
+            timeout=_timeout_for(self.config.timeout),
+            headers=self._headers,
+            raise_for_status=True,
+        )
+
+    def _shared_session(self) -> aiohttp.ClientSession:
+        """Get or create the process-wide session for this client's settings.
+
+        Sessions are kept per running event loop and keyed by every config
+        field that affects the session, so clients only share a session when
+        it would have been configured identically. Sessions that differ only
+        in API key or timeout (e.g. one client per tenant) still share one
+        connection pool per server host and port. No lock is needed: the
+        lookups and creation run synchronously on the event loop thread.
+
+        Returns:
+            The shared ClientSession for this configuration
+        """
+        config = self.config
+        pools = self._pools_for(asyncio.get_running_loop())
+        base = config.base_url
+        connector_key = (
+            base.scheme,
+            base.host,
+            base.port,
+            config.connection_limit,
+            config.per_host_limit,
+            config.keepalive_timeout,
+        )
+        connector = pools.connectors.get(connector_key)
+        if connector is None or connector.closed:
+            connector = self._create_connector()
+            pools.connectors[connector_key] = connector
+
+        key = (
+            config.url,
+            config.api_key,
+            config.timeout,
+            config.connection_limit,
+            config.per_host_limit,
+            config.keepalive_timeout,
+        )
+        session = pools.sessions.get(key)
+        if session is None or session.closed or session.connector is not connector:
+            session = self._create_session(connector)
+            pools.sessions[key] = session
+        return session
+
+    @classmethod
+    def _pools_for(cls, loop: asyncio.AbstractEventLoop) -> _SharedPools:
+        """Get or create the shared pools of an event loop.
+
+        Args:
+            loop: The running event loop
+
+        Returns:
+            The loop's shared sessions and connection pools
+        """
+        pools = cls._shared_pools.get(loop)
+        if pools is not None:
+            return pools
+
+        # Forget loops that were closed without shutting down their async
+        # generators; their sessions can no longer be closed
+        for stale in [other for other in cls._shared_pools if other.is_closed()]:
+            del cls._shared_pools[stale]
+
+        pools = cls._shared_pools[loop] = _SharedPools()
+        hook = _close_at_loop_shutdown(loop, pools)
+        pools.shutdown_hook = hook
+        # Advance the hook to its yield (nothing before it suspends), which
+        # also registers it with the running loop
+        try:
+            hook.__anext__().send(None)
+        except StopIteration:
+            pass
+        return pools
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the sessions and connection pools shared on this event loop.
+
+        Call this once at application shutdown; closing an individual client
+        leaves its shared session open for other clients. Pools of other
+        event loops are left alone; each is closed when its loop shuts down.
+
+        Example:
+            >>> config = ComfyUIConfig(url="http://127.0.0.1:8188", share_session=True)
+            >>> async with ComfyUIClient(config) as client:
+            ...     await client.validate_connection()
+            >>> await ComfyUIClient.close_all()
+        """
+        pools = cls._shared_pools.pop(asyncio.get_running_loop(), None)
+        if pools is not None:
+            await pools.close()
 
     async def close(self) -> None:
         """Close the aiohttp session and clean up resources.
 
         This method safely closes the aiohttp session if it exists. It's safe to
         call multiple times - subsequent calls are no-ops if the session is already
-        closed or was never created.
+        closed or was never created. With ``share_session`` enabled the client
+        only releases its reference; the shared session stays open until
+        close_all() is called.
 
         Example:
             >>> client = ComfyUIClient(config)
@@ -127,6 +519,11 @@ class ComfyUIClient:
             >>> await client.close()  # Closes the session
             >>> await client.close()  # Safe to call again
         """
+        if self.config.share_session:
+            # Shared sessions outlive individual clients; see close_all()
+            self._session = None
+            return
+
         if self._session is not None and not self._session.closed:
             self.logger.debug("Closing aiohttp session")
             await self._session.close()
@@ -135,9 +532,11 @@ class ComfyUIClient:
     async def validate_connection(self) -> bool:
         """Validate connection to the ComfyUI server.
 
-        This method performs a simple health check by attempting to connect to
-        the ComfyUI server's /queue endpoint. It returns True if the server is
-        reachable and responds successfully, False otherwise.
+        This method performs a simple health check by sending a HEAD request
+        to the ComfyUI server's /queue endpoint, so no queue document is
+        transferred. Servers that reject HEAD with 405 are asked again with
+        GET. It returns True if the server is reachable and responds
+        successfully, False otherwise.
 
         Returns:
             True if connection is successful, False if server is unreachable,
@@ -153,33 +552,28 @@ class ComfyUIClient:
             ...     print("ComfyUI server is not available")
         """
         try:
-            base_url = self.config.url.rstrip("/")
-            url = f"{base_url}/queue"
+            url = self._queue_url
             self.logger.info(f"Validating connection to {url}")
-            async with self.session.get(url) as response:
-                # Consider 2xx status codes as successful connection
+            async with self.session.head(url, raise_for_status=False) as response:
                 status: int = response.status
-                success = 200 <= status < 300
-                if success:
-                    self.logger.info(
-                        f"Connection validated successfully (status={status})"
-                    )
-                else:
-                    self.logger.warning(
-                        f"Connection validation failed (status={status})"
-                    )
-                return success
-        except (
-            aiohttp.ClientConnectorError,
-            aiohttp.ClientError,
-            TimeoutError,
-            Exception,
-        ) as e:
+            if status == 405:
+                # HEAD not allowed on this server; fall back to a full GET
+                async with self.session.get(url, raise_for_status=False) as response:
+                    status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
             # Any connection error means server is not reachable
             self.logger.error(f"Connection validation failed: {type(e).__name__}: {e}")
             return False
 
-    async def health_check(self, endpoint: str = "/queue") -> dict[str, Any]:
+        # Consider 2xx status codes as successful connection
+        success = 200 <= status < 300
+        if success:
+            self.logger.info(f"Connection validated successfully (status={status})")
+        else:
+            self.logger.warning(f"Connection validation failed (status={status})")
+        return success
+
+    async def health_check(self, endpoint: str = "/queue") -> HealthCheckResult:
         """Perform comprehensive health check on ComfyUI server.
 
         This method attempts to connect to the ComfyUI server and returns
@@ -192,7 +586,7 @@ class ComfyUIClient:
                      to check other endpoints like "/history" or "/system_stats".
 
         Returns:
-            Dictionary containing health check results with keys:
+            HealthCheckResult dictionary with keys:
             - connected (bool): Whether connection was successful
             - url (str): The full URL that was checked
             - status_code (int, optional): HTTP status code if connection succeeded
@@ -212,28 +606,22 @@ class ComfyUIClient:
             Check custom endpoint:
             >>> health = await client.health_check(endpoint="/system_stats")
         """
-        base_url = self.config.url.rstrip("/")
-        url = f"{base_url}{endpoint}"
-        result: dict[str, Any] = {
-            "connected": False,
-            "url": url,
-        }
+        url = self._base_url + endpoint
 
         try:
-            async with self.session.get(url) as response:
-                result["status_code"] = response.status
-                # Consider 2xx status codes as successful
-                result["connected"] = 200 <= response.status < 300
+            async with self.session.get(url, raise_for_status=False) as response:
+                status: int = response.status
         except aiohttp.ClientConnectorError as e:
-            result["error"] = f"Connection failed: {e}"
+            error = f"Connection failed: {e}"
         except aiohttp.ClientError as e:
-            result["error"] = f"Client error: {e}"
-        except TimeoutError:
-            result["error"] = "Request timed out"
-        except Exception as e:
-            result["error"] = f"Unexpected error: {e}"
+            error = f"Client error: {e}"
+        except asyncio.TimeoutError:
+            error = "Request timed out"
+        else:
+            # Consider 2xx status codes as successful
+            return {"connected": 200 <= status < 300, "url": url, "status_code": status}
 
-        return result
+        return {"connected": False, "url": url, "error": error}
 
     @retry_with_backoff()
     async def submit_workflow(self, workflow: WorkflowPrompt) -> dict[str, Any]:
@@ -241,7 +629,7 @@ class ComfyUIClient:
 
         This method submits a workflow prompt to the ComfyUI server's /prompt endpoint
         for processing. The workflow is converted to the proper API format using the
-        WorkflowPrompt.to_api_format() method before submission.
+        WorkflowPrompt.to_api_bytes() method before submission.
 
         Args:
             workflow: WorkflowPrompt object containing nodes and configuration
@@ -278,19 +666,16 @@ class ComfyUIClient:
             ... )
             >>> response = await client.submit_workflow(workflow)
         """
-        base_url = self.config.url.rstrip("/")
-        url = f"{base_url}/prompt"
+        url = self._prompt_url
 
-        # Convert workflow to ComfyUI API format
-        payload = workflow.to_api_format()
+        # Serialize the API format once (orjson when available) rather than
+        # via aiohttp's json=
+        body = workflow.to_api_bytes()
 
         # Submit workflow via POST request
-        async with self.session.post(url, json=payload) as response:
-            # Raise exception for HTTP errors (4xx, 5xx)
-            response.raise_for_status()
-
+        async with self.session.post(url, data=body, headers=_JSON_HEADERS) as response:
             # Return the JSON response
-            result: dict[str, Any] = await response.json()
+            result: dict[str, Any] = _json.loads(await response.read())
             return result
 
     @retry_with_backoff()
@@ -324,47 +709,73 @@ class ComfyUIClient:
             >>> print(f"State: {status.state}, Position: {status.queue_position}")
             State: WorkflowState.QUEUED, Position: 2
         """
-        base_url = self.config.url.rstrip("/")
-        url = f"{base_url}/queue"
+        queue_index = _index_queue(await self._fetch_queue())
+        return _status_from_index(prompt_id, queue_index)
+
+    @retry_with_backoff()
+    async def get_queue_statuses(
+        self, prompt_ids: Iterable[str]
+    ) -> dict[str, WorkflowStatus]:
+        """Get queue status for several workflows with a single /queue request.
+
+        Polling many prompts with get_queue_status() fetches the queue once per
+        prompt; this method fetches it once and resolves every ID against it.
+
+        Args:
+            prompt_ids: Prompt IDs returned from submit_workflow
+
+        Returns:
+            Dictionary mapping each prompt ID to its WorkflowStatus, with the
+            same semantics as get_queue_status()
+
+        Raises:
+            aiohttp.ClientError: If there's an HTTP error
+            aiohttp.ClientConnectorError: If cannot connect to server
+            TimeoutError: If the request times out
+
+        Example:
+            >>> statuses = await client.get_queue_statuses(["prompt-1", "prompt-2"])
+            >>> print(statuses["prompt-2"].queue_position)
+            0
+        """
+        queue_index = _index_queue(await self._fetch_queue())
+        return {
+            prompt_id: _status_from_index(prompt_id, queue_index)
+            for prompt_id in prompt_ids
+        }
+
+    async def _fetch_queue(self) -> dict[str, Any]:
+        """Fetch the raw /queue document from the server.
+
+        If the server (or a reverse proxy in front of it) tags /queue
+        responses with an ETag, the request is made conditional with
+        If-None-Match and a 304 Not Modified reuses the last decoded
+        document, skipping the body transfer and JSON parsing.
+
+        Returns:
+            Decoded /queue response with queue_running and queue_pending lists
+
+        Raises:
+            aiohttp.ClientResponseError: If the server returns an error status
+        """
+        headers = None
+        if self._queue_etag is not None:
+            headers = {"If-None-Match": self._queue_etag}
 
         # Query the queue endpoint
-        async with self.session.get(url) as response:
-            # Raise exception for HTTP errors (4xx, 5xx)
-            response.raise_for_status()
+        async with self.session.get(self._queue_url, headers=headers) as response:
+            if response.status == 304 and self._queue_data is not None:
+                return self._queue_data
 
             # Get the queue data
-            queue_data: dict[str, Any] = await response.json()
-
-        # Extract running and pending queues
-        queue_running: list[list[Any]] = queue_data.get("queue_running", [])
-        queue_pending: list[list[Any]] = queue_data.get("queue_pending", [])
-
-        # Check if prompt is currently running
-        for item in queue_running:
-            if len(item) > 0 and item[0] == prompt_id:
-                return WorkflowStatus(
-                    state=WorkflowState.RUNNING,
-                    queue_position=None,
-                    progress=0.0,
-                )
-
-        # Check if prompt is in pending queue
-        for index, item in enumerate(queue_pending):
-            if len(item) > 0 and item[0] == prompt_id:
-                return WorkflowStatus(
-                    state=WorkflowState.QUEUED,
-                    queue_position=index,
-                    progress=0.0,
-                )
+            queue_data: dict[str, Any] = _json.loads(await response.read())
+            etag = response.headers.get("ETag")
 
-        # If not found in either queue, assume it's completed
-        return WorkflowStatus(
-            state=WorkflowState.COMPLETED,
-            queue_position=None,
-            progress=1.0,
-        )
+        # Remember the document only when it can be revalidated later
+        self._queue_etag = etag
+        self._queue_data = queue_data if etag is not None else None
+        return queue_data
 
-    @retry_with_backoff()
     async def get_history(self, prompt_id: str) -> GenerationResult:
         """Get workflow execution history and results for a specific prompt ID.
 
@@ -397,62 +808,165 @@ class ComfyUIClient:
             >>> print(f"Generated images: {result.images}")
             Generated images: ['output/image_001.png']
         """
-        base_url = self.config.url.rstrip("/")
-        url = f"{base_url}/history/{prompt_id}"
+        prompt_history = await self._fetch_history_entry(prompt_id)
+        if prompt_history is None:
+            raise ValueError(f"Prompt ID '{prompt_id}' not found in history")
 
-        # Query the history endpoint
-        async with self.session.get(url) as response:
-            # Raise exception for HTTP errors (4xx, 5xx)
-            response.raise_for_status()
+        # Build the result from the prompt's history entry
+        result = _result_from_history(prompt_id, prompt_history)
+        if result is None:
+            raise ValueError(
+                f"No outputs found for prompt ID '{prompt_id}'. "
+                "Workflow may not have completed yet."
+            )
+        return result
 
-            # Get the history data
-            history_data: dict[str, Any] = await response.json()
+    async def wait_for_result(
+        self,
+        prompt_id: str,
+        *,
+        poll_interval: float = 0.05,
+        max_poll_interval: float = 2.0,
+        timeout: float | None = None,
+    ) -> GenerationResult:
+        """Wait for a submitted workflow to finish and return its result.
+
+        Polls /history/{prompt_id} until the prompt appears there, which
+        ComfyUI does once execution has finished. The first poll is immediate;
+        the delay between polls then starts at poll_interval and doubles up
+        to max_poll_interval, so short generations are picked up within
+        milliseconds while long ones cost few requests. Once the delay has
+        reached max_poll_interval, each miss also checks the queue, so a
+        prompt that was deleted from the queue (and will therefore never
+        reach the history) fails instead of being waited for forever.
 
-        # Check if prompt_id exists in history
-        if prompt_id not in history_data:
-            raise ValueError(f"Prompt ID '{prompt_id}' not found in history")
+        Args:
+            prompt_id: The unique prompt ID returned from submit_workflow
+            poll_interval: Delay before the second poll, in seconds
+            max_poll_interval: Upper bound for the delay between polls
+            timeout: Give up after this many seconds. None (default) waits
+                     until the prompt finishes.
 
-        # Get the specific prompt history
-        prompt_history: dict[str, Any] = history_data[prompt_id]
+        Returns:
+            GenerationResult for the finished prompt
 
-        # Extract outputs
-        outputs: dict[str, Any] = prompt_history.get("outputs", {})
+        Raises:
+            aiohttp.ClientError: If there's an HTTP error
+            aiohttp.ClientConnectorError: If cannot connect to server
+            TimeoutError: If the result is not available within timeout
+            ValueError: If the poll intervals are not positive, the prompt
+                        is neither queued nor in the history, or the
+                        finished prompt has no outputs
 
-        if not outputs:
-            raise ValueError(
-                f"No outputs found for prompt ID '{prompt_id}'. "
-                "Workflow may not have completed yet."
+        Example:
+            >>> response = await client.submit_workflow(workflow)
+            >>> result = await client.wait_for_result(response["prompt_id"])
+            >>> print(f"Generated images: {result.images}")
+        """
+        if poll_interval <= 0 or max_poll_interval <= 0:
+            msg = (
+                "poll_interval and max_poll_interval must be positive, got "
+                f"{poll_interval} and {max_poll_interval}"
             )
+            raise ValueError(msg)
+
+        async def poll() -> dict[str, Any]:
+            delay = poll_interval
+            while (
+                prompt_history := await self._fetch_history_entry(prompt_id)
+            ) is None:
+                # The queue is only consulted once polling has slowed down,
+                # so short generations cost no extra requests
+                if delay >= max_poll_interval:
+                    status = await self.get_queue_status(prompt_id)
+                    if status.state is WorkflowState.COMPLETED:
+                        # No longer queued or running: either it finished
+                        # after the history request, or it was removed from
+                        # the queue and will never appear in the history
+                        prompt_history = await self._fetch_history_entry(prompt_id)
+                        if prompt_history is None:
+                            msg = (
+                                f"Prompt ID '{prompt_id}' is no longer queued "
+                                "and not found in history"
+                            )
+                            raise ValueError(msg)
+                        return prompt_history
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+            return prompt_history
+
+        prompt_history = await asyncio.wait_for(poll(), timeout)
+
+        result = _result_from_history(prompt_id, prompt_history)
+        if result is None:
+            raise ValueError(f"No outputs found for prompt ID '{prompt_id}'")
+        return result
 
-        # Collect all images from all output nodes
-        image_paths: list[str] = []
-
-        for _node_id, node_output in outputs.items():
-            # Check if this output node has images
-            if "images" in node_output:
-                images_list: list[dict[str, Any]] = node_output["images"]
-
-                for image_info in images_list:
-                    filename: str = image_info.get("filename", "")
-                    subfolder: str = image_info.get("subfolder", "")
-
-                    # Construct full path
-                    if subfolder:
-                        full_path = f"{subfolder}/{filename}"
-                    else:
-                        full_path = filename
-
-                    if full_path:
-                        image_paths.append(full_path)
-
-        # Create and return GenerationResult
-        return GenerationResult(
-            images=image_paths,
-            execution_time=0.0,  # TODO: Extract from history if available
-            metadata={},  # TODO: Extract workflow metadata if needed
-            prompt_id=prompt_id,
-            seed=None,  # TODO: Extract seed from workflow if needed
-        )
+    @retry_with_backoff()
+    async def _fetch_history_entry(self, prompt_id: str) -> dict[str, Any] | None:
+        """Fetch one prompt's /history entry.
+
+        Args:
+            prompt_id: Prompt ID to look up
+
+        Returns:
+            The prompt's history entry, or None if it is not in the history
+            (yet)
+        """
+        url = self._history_url / prompt_id
+
+        # Query the history endpoint. The body is always read in full so the
+        # keep-alive connection can go back to the pool.
+        async with self.session.get(url) as response:
+            body = await response.read()
+
+        # The per-prompt endpoint answers {} for IDs it does not know (yet),
+        # the common case while polling; recognize it without decoding
+        if body == _EMPTY_HISTORY:
+            return None
+
+        history_data: dict[str, Any] = _json.loads(body)
+        return history_data.get(prompt_id)
+
+    @retry_with_backoff()
+    async def get_histories(
+        self, prompt_ids: Iterable[str]
+    ) -> dict[str, GenerationResult]:
+        """Get results for several workflows with a single /history request.
+
+        Fetches the server's whole history once (GET /history) and picks out
+        the requested prompts, so polling many prompts costs one round trip
+        instead of one per prompt. Prompts that are unknown to the server or
+        have no outputs yet are left out of the result rather than raising,
+        which lets callers poll until every ID is present.
+
+        Args:
+            prompt_ids: Prompt IDs returned from submit_workflow
+
+        Returns:
+            Dictionary mapping each finished prompt ID to its GenerationResult
+
+        Raises:
+            aiohttp.ClientError: If there's an HTTP error
+            aiohttp.ClientConnectorError: If cannot connect to server
+            TimeoutError: If the request times out
+
+        Example:
+            >>> results = await client.get_histories(["prompt-1", "prompt-2"])
+            >>> pending = {"prompt-1", "prompt-2"} - results.keys()
+        """
+        # Query the full history endpoint
+        async with self.session.get(self._history_url) as response:
+            history_data: dict[str, Any] = _json.loads(await response.read())
+
+        results: dict[str, GenerationResult] = {}
+        for prompt_id in prompt_ids:
+            prompt_history = history_data.get(prompt_id)
+            if prompt_history:
+                result = _result_from_history(prompt_id, prompt_history)
+                if result is not None:
+                    results[prompt_id] = result
+        return results
 
     @retry_with_backoff()
     async def download_image(
@@ -494,24 +1008,134 @@ class ComfyUIClient:
             ...     subfolder="2024-01"
             ... )
         """
-        base_url = self.config.url.rstrip("/")
-        url = f"{base_url}/view"
+        url, params = self._view_request(filename, subfolder, image_type)
 
+        # Download the image
+        async with self.session.get(url, params=params) as response:
+            # Read and return the raw image bytes
+            image_bytes: bytes = await response.read()
+            return image_bytes
+
+    @retry_with_backoff()
+    async def download_image_to(
+        self,
+        destination: Path | str,
+        filename: str,
+        subfolder: str = "",
+        image_type: str = "output",
+    ) -> int:
+        """Stream a generated image from ComfyUI straight to a file.
+
+        Unlike download_image(), the image is never held in memory as a whole:
+        the response body is written in DOWNLOAD_CHUNK_SIZE chunks to a
+        temporary ``.part`` file next to the destination, which is renamed
+        into place once the download completes. A failed download leaves any
+        existing destination file untouched.
+
+        Args:
+            destination: Path of the file to write
+            filename: The image filename (e.g., "ComfyUI_00001_.png")
+            subfolder: Optional subfolder path (e.g., "2024-01", default: "")
+            image_type: Type of image (default: "output", can be "temp", "input", etc.)
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            aiohttp.ClientError: If there's an HTTP error
+            aiohttp.ClientResponseError: If image not found (404) or server error
+            TimeoutError: If the request times out
+            OSError: If the destination cannot be written
+
+        Example:
+            >>> size = await client.download_image_to(
+            ...     "assets/warrior.png", "ComfyUI_00001_.png"
+            ... )
+        """
+        destination = Path(destination)
+        partial = destination.with_name(f"{destination.name}.part")
+        url, params = self._view_request(filename, subfolder, image_type)
+
+        written = 0
+        try:
+            async with self.session.get(url, params=params) as response:
+                with open(partial, "wb") as f:
+                    async for chunk in response.content.iter_chunked(
+                        DOWNLOAD_CHUNK_SIZE
+                    ):
+                        f.write(chunk)
+                        written += len(chunk)
+            os.replace(partial, destination)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        return written
+
+    async def download_images(
+        self,
+        items: Iterable[tuple[str, str, str]],
+        concurrency: int = 8,
+    ) -> list[bytes]:
+        """Download several images in parallel with bounded concurrency.
+
+        Each item is fetched with download_image() (including its retry
+        behaviour), with at most ``concurrency`` requests in flight at once.
+
+        Args:
+            items: (filename, subfolder, image_type) tuples, as accepted by
+                   download_image()
+            concurrency: Maximum number of simultaneous downloads (default: 8)
+
+        Returns:
+            Raw image bytes for each item, in the same order as items
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            aiohttp.ClientError: If any download fails after retries
+
+        Example:
+            >>> images = await client.download_images(
+            ...     [("a.png", "", "output"), ("b.png", "2024-01", "output")]
+            ... )
+            >>> len(images)
+            2
+        """
+        if concurrency < 1:
+            msg = f"concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download_one(filename: str, subfolder: str, image_type: str) -> bytes:
+            async with semaphore:
+                image_bytes: bytes = await self.download_image(
+                    filename, subfolder, image_type
+                )
+                return image_bytes
+
+        return list(await asyncio.gather(*(download_one(*item) for item in items)))
+
+    def _view_request(
+        self, filename: str, subfolder: str, image_type: str
+    ) -> tuple[URL, dict[str, str]]:
+        """Build the URL and query parameters for the /view endpoint.
+
+        Args:
+            filename: The image filename
+            subfolder: Subfolder path, or "" for none
+            image_type: Type of image ("output", "temp", "input", ...)
+
+        Returns:
+            Tuple of (URL, query parameters)
+        """
         # Build query parameters for ComfyUI /view endpoint
         params = {
             "filename": filename,
             "subfolder": subfolder,
             "type": image_type,
         }
-
-        # Download the image
-        async with self.session.get(url, params=params) as response:
-            # Raise exception for HTTP errors (4xx, 5xx)
-            response.raise_for_status()
-
-            # Read and return the raw image bytes
-            image_bytes: bytes = await response.read()
-            return image_bytes
+        return self._view_url, params
 
     @retry_with_backoff()
     async def cancel_workflow(
@@ -570,8 +1194,6 @@ class ComfyUIClient:
         if prompt_id is None and not interrupt_running:
             raise ValueError("Must provide either prompt_id or interrupt_running=True")
 
-        base_url = self.config.url.rstrip("/")
-
         # Delete specific workflow(s) from queue if prompt_id provided
         if prompt_id is not None:
             # Convert single prompt_id to list for consistent handling
@@ -580,19 +1202,20 @@ class ComfyUIClient:
             )
 
             # POST to /queue endpoint with delete payload
-            queue_url = f"{base_url}/queue"
             payload = {"delete": prompt_ids}
 
-            async with self.session.post(queue_url, json=payload) as response:
-                response.raise_for_status()
+            async with self.session.post(
+                self._queue_url,
+                data=_json.dumps_bytes(payload),
+                headers=_JSON_HEADERS,
+            ):
+                pass  # Error statuses raise on entry (session raise_for_status)
 
         # Interrupt currently running workflow if requested
         if interrupt_running:
             # POST to /interrupt endpoint
-            interrupt_url = f"{base_url}/interrupt"
-
-            async with self.session.post(interrupt_url) as response:
-                response.raise_for_status()
+            async with self.session.post(self._interrupt_url):
+                pass  # Error statuses raise on entry (session raise_for_status)
 
         return True
 
@@ -637,4 +1260,4 @@ class ComfyUIClient:
         await self.close()
 
 
-__all__ = ["ComfyUIClient"]
+__all__ = ["ComfyUIClient", "HealthCheckResult"]
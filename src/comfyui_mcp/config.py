@@ -23,20 +23,66 @@ Example:
     >>> config_path = find_config_file()
     >>> if config_path:
     ...     config = ComfyUIConfig.from_file(config_path)
+
+Resolved configurations can optionally be cached on disk (see
+``load_config(use_cache=True)``) so short-lived CLI invocations skip
+re-parsing an unchanged TOML file.
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 try:
     import tomllib  # Python 3.11+
 except ImportError:
     import tomli as tomllib
 
+from comfyui_mcp._version import __version__
 from comfyui_mcp.models import ComfyUIConfig
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _strip(value: Any) -> Any:
+    """Strip surrounding whitespace from strings, passing other values through."""
+    return value.strip() if isinstance(value, str) else value
+
+
+# Fields load_config() reads, as (ComfyUIConfig field, environment variable
+# or None if the field is file-only, parser applied to the raw value)
+_CONFIG_FIELDS: tuple[tuple[str, str | None, Callable[[Any], Any] | None], ...] = (
+    ("url", "COMFYUI_URL", _strip),
+    ("api_key", "COMFYUI_API_KEY", _strip),
+    ("timeout", "COMFYUI_TIMEOUT", float),
+    ("output_dir", "COMFYUI_OUTPUT_DIR", _strip),
+    # Connection pool tuning and session sharing
+    ("connection_limit", None, None),
+    ("per_host_limit", None, None),
+    ("keepalive_timeout", None, None),
+    ("share_session", None, None),
+)
+
+# Environment variables that feed into load_config()
+CONFIG_ENV_VARS: tuple[str, ...] = tuple(
+    env_var for _, env_var, _ in _CONFIG_FIELDS if env_var is not None
+)
+
+# File name of the resolved-configuration cache inside get_cache_dir()
+CONFIG_CACHE_FILENAME = "config.json"
+
+# Server URL used when no configuration can be loaded
+DEFAULT_COMFYUI_URL = "http://localhost:8188"
+
+# System-wide config directory searched last (there is none on Windows)
+_SYSTEM_CONFIG_DIR: Path | None = None if os.name == "nt" else Path("/etc/comfyui")
+
 
 def find_config_file(filename: str = "comfyui.toml") -> Path | None:
     """Search for configuration file in standard locations.
@@ -46,6 +92,11 @@ def find_config_file(filename: str = "comfyui.toml") -> Path | None:
     2. User config directory (~/.config/comfyui/comfyui.toml)
     3. System directory (/etc/comfyui/comfyui.toml, Unix only)
 
+    Results are memoized per (filename, working directory, home directory),
+    so repeated lookups in a long-running process skip the filesystem
+    checks. Call clear_config_file_cache() to pick up config files created
+    or removed after the first lookup.
+
     Args:
         filename: Name of the configuration file to search for.
                   Defaults to "comfyui.toml".
@@ -61,37 +112,188 @@ def find_config_file(filename: str = "comfyui.toml") -> Path | None:
         ... else:
         ...     print("No config file found")
     """
+    home_var = "USERPROFILE" if os.name == "nt" else "HOME"
+    return _find_config_file_cached(filename, os.getcwd(), os.environ.get(home_var))
+
+
+@functools.lru_cache(maxsize=8)
+def _find_config_file_cached(filename: str, cwd: str, home: str | None) -> Path | None:
+    """Search the standard locations for a config file (memoized).
+
+    Args:
+        filename: Name of the configuration file to search for
+        cwd: Current working directory at lookup time
+        home: User home directory (HOME, or USERPROFILE on Windows), if set
+
+    Returns:
+        Path to the first configuration file found, or None
+    """
     # List of paths to search (in priority order)
     search_paths: list[Path] = []
 
     # 1. Current directory
-    search_paths.append(Path.cwd() / filename)
+    search_paths.append(Path(cwd) / filename)
 
     # 2. User config directory
-    if os.name == "nt":  # Windows
-        # Windows: %USERPROFILE%\.config\comfyui\comfyui.toml
-        user_profile = os.environ.get("USERPROFILE")
-        if user_profile:
-            search_paths.append(Path(user_profile) / ".config" / "comfyui" / filename)
-    else:  # Unix-like (Linux, macOS)
-        # Unix: ~/.config/comfyui/comfyui.toml
-        home = os.environ.get("HOME")
-        if home:
-            search_paths.append(Path(home) / ".config" / "comfyui" / filename)
+    # Windows: %USERPROFILE%\.config\comfyui\comfyui.toml
+    # Unix: ~/.config/comfyui/comfyui.toml
+    if home:
+        search_paths.append(Path(home) / ".config" / "comfyui" / filename)
 
     # 3. System directory (Unix only)
-    if os.name != "nt":
-        search_paths.append(Path("/etc") / "comfyui" / filename)
+    if _SYSTEM_CONFIG_DIR is not None:
+        search_paths.append(_SYSTEM_CONFIG_DIR / filename)
 
-    # Search for the first existing file
+    # Search for the first existing file; is_file() is False for missing
+    # paths, so a single stat per candidate is enough
     for path in search_paths:
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path
 
     return None
 
 
-def load_config() -> ComfyUIConfig:
+def clear_config_file_cache() -> None:
+    """Forget memoized find_config_file() results.
+
+    Long-running processes (such as the MCP server) can call this to notice
+    configuration files that were created or removed since the last lookup.
+
+    Example:
+        >>> clear_config_file_cache()
+        >>> config_path = find_config_file()  # searches the filesystem again
+    """
+    _find_config_file_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def default_config() -> ComfyUIConfig:
+    """Return the shared fallback configuration for a local ComfyUI server.
+
+    ComfyUIConfig is frozen, so a single validated instance is built on
+    first use and returned to every caller.
+
+    Returns:
+        ComfyUIConfig pointing at DEFAULT_COMFYUI_URL with default settings
+
+    Example:
+        >>> config = default_config()
+        >>> print(config.url)
+        http://localhost:8188
+    """
+    return ComfyUIConfig(url=DEFAULT_COMFYUI_URL)
+
+
+def get_cache_dir() -> Path:
+    """Return the directory used for comfyui-mcp cache files.
+
+    Follows the XDG Base Directory specification: ``$XDG_CACHE_HOME/comfyui-mcp``
+    when ``XDG_CACHE_HOME`` is set, otherwise ``~/.cache/comfyui-mcp``. The
+    directory is not created.
+
+    Returns:
+        Path to the comfyui-mcp cache directory
+
+    Example:
+        >>> cache_dir = get_cache_dir()
+        >>> print(cache_dir.name)
+        comfyui-mcp
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "comfyui-mcp"
+
+
+def _config_cache_key(config_file: Path | None) -> str:
+    """Build the cache key for the configuration resolved from these inputs.
+
+    The key covers the package version, the discovered config file (path,
+    modification time and size) and every environment variable
+    load_config() reads, so upgrading the package, editing the file or
+    changing the environment invalidates the cached entry.
+
+    Args:
+        config_file: Config file returned by find_config_file(), if any
+
+    Returns:
+        Hex digest identifying the configuration inputs
+    """
+    file_state: tuple[str, int, int] | None = None
+    if config_file is not None:
+        try:
+            stat = config_file.stat()
+        except OSError:
+            pass
+        else:
+            file_state = (str(config_file), stat.st_mtime_ns, stat.st_size)
+
+    env_state = tuple(os.environ.get(name) for name in CONFIG_ENV_VARS)
+    return hashlib.blake2b(
+        repr((__version__, file_state, env_state)).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _read_cached_config(cache_file: Path, key: str) -> ComfyUIConfig | None:
+    """Return the cached configuration if it was stored under ``key``.
+
+    Args:
+        cache_file: Path of the cache file
+        key: Cache key for the current configuration inputs
+
+    Returns:
+        The cached ComfyUIConfig, or None on a miss or unreadable cache
+    """
+    try:
+        cached: dict[str, Any] = json.loads(cache_file.read_bytes())
+        if cached.get("key") != key:
+            return None
+        return ComfyUIConfig.model_validate(cached["config"])
+    except Exception:
+        # A corrupt or stale-format cache is just a miss
+        return None
+
+
+def write_cache_file(cache_file: Path, payload: str) -> None:
+    """Atomically write a cache file readable by the current user only.
+
+    The payload is written to a temporary file next to ``cache_file`` and
+    moved into place with os.replace(), so concurrent readers never see a
+    partial file. Failures are ignored; caching is best effort.
+
+    Args:
+        cache_file: Destination path (parent directories are created)
+        payload: Text to store
+
+    Example:
+        >>> write_cache_file(get_cache_dir() / "example.json", "{}")
+    """
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _write_cached_config(cache_file: Path, key: str, config: ComfyUIConfig) -> None:
+    """Store a resolved configuration in the cache file.
+
+    The file may contain the API key, which is why write_cache_file()
+    restricts it to the current user.
+
+    Args:
+        cache_file: Path of the cache file
+        key: Cache key for the configuration inputs
+        config: Resolved configuration to store
+    """
+    payload = json.dumps({"key": key, "config": config.model_dump(mode="json")})
+    write_cache_file(cache_file, payload)
+
+
+def load_config(*, use_cache: bool = False) -> ComfyUIConfig:
     """Load configuration with automatic fallback priority.
 
     Loads configuration using the following priority (highest to lowest):
@@ -103,6 +305,12 @@ def load_config() -> ComfyUIConfig:
     If an environment variable is not set, the corresponding value from the
     config file is used. If neither is set, the default value is used.
 
+    Args:
+        use_cache: Reuse the configuration resolved by a previous call when
+                   the config file and COMFYUI_* environment variables are
+                   unchanged. The result is cached as JSON in
+                   get_cache_dir(). Defaults to False.
+
     Returns:
         ComfyUIConfig instance with values loaded from the highest priority
         source available for each configuration field.
@@ -124,50 +332,67 @@ def load_config() -> ComfyUIConfig:
         - All defaults if neither environment nor file available
     """
     # Start with values from config file if available
-    config_data: dict[str, str | float | None] = {}
+    config_data: dict[str, Any] = {}
 
     # Try to load from config file
     config_file = find_config_file()
+
+    # The cache location is only resolved when caching was asked for, since
+    # get_cache_dir() needs a home directory when XDG_CACHE_HOME is unset
+    cache: tuple[Path, str] | None = None
+    if use_cache:
+        cache = (
+            get_cache_dir() / CONFIG_CACHE_FILENAME,
+            _config_cache_key(config_file),
+        )
+        cached = _read_cached_config(*cache)
+        if cached is not None:
+            return cached
+
+    file_config: dict[str, Any] = {}
     if config_file is not None:
         try:
-            with open(config_file, "rb") as f:
-                toml_data = tomllib.load(f)
-
-            if "comfyui" in toml_data:
-                file_config = toml_data["comfyui"]
-                # Extract values from file
-                if "url" in file_config:
-                    config_data["url"] = file_config["url"]
-                if "api_key" in file_config:
-                    config_data["api_key"] = file_config["api_key"]
-                if "timeout" in file_config:
-                    config_data["timeout"] = float(file_config["timeout"])
-                if "output_dir" in file_config:
-                    config_data["output_dir"] = file_config["output_dir"]
+            toml_data = tomllib.loads(config_file.read_text(encoding="utf-8"))
+            section = toml_data.get("comfyui")
+            # A "comfyui" key that is not a table is ignored like a missing one
+            if isinstance(section, dict):
+                file_config = section
         except Exception:
             # If file loading fails, just continue without it
             pass
 
-    # Override with environment variables (higher priority)
-    env_url = os.environ.get("COMFYUI_URL")
-    if env_url:
-        config_data["url"] = env_url.strip()
+    # Environment variables override file values; values that fail to parse
+    # (e.g. a non-numeric timeout) are ignored in favour of the next source
+    for field, env_var, parser in _CONFIG_FIELDS:
+        sources = [file_config.get(field)]
+        if env_var is not None:
+            sources.append(os.environ.get(env_var) or None)
+        for value in sources:
+            if value is None:
+                continue
+            try:
+                config_data[field] = value if parser is None else parser(value)
+            except (TypeError, ValueError):
+                pass
+
+    # If no URL from either source, must come from environment or will fail validation
+    # The ComfyUIConfig constructor will handle validation
+    config = ComfyUIConfig(**config_data)  # type: ignore[arg-type]
 
-    env_api_key = os.environ.get("COMFYUI_API_KEY")
-    if env_api_key:
-        config_data["api_key"] = env_api_key.strip()
+    if cache is not None:
+        _write_cached_config(*cache, config)
 
-    env_timeout = os.environ.get("COMFYUI_TIMEOUT")
-    if env_timeout:
-        try:
-            config_data["timeout"] = float(env_timeout)
-        except ValueError:
-            pass  # Ignore invalid timeout, use default or file value
+    return config
 
-    env_output_dir = os.environ.get("COMFYUI_OUTPUT_DIR")
-    if env_output_dir:
-        config_data["output_dir"] = env_output_dir.strip()
 
-    # If no URL from either source, must come from environment or will fail validation
-    # The ComfyUIConfig constructor will handle validation
-    return ComfyUIConfig(**config_data)  # type: ignore[arg-type]
+__all__ = [
+    "CONFIG_CACHE_FILENAME",
+    "CONFIG_ENV_VARS",
+    "DEFAULT_COMFYUI_URL",
+    "clear_config_file_cache",
+    "default_config",
+    "find_config_file",
+    "get_cache_dir",
+    "load_config",
+    "write_cache_file",
+]
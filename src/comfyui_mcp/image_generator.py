@@ -24,14 +24,36 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
     from comfyui_mcp.comfyui_client import ComfyUIClient
     from comfyui_mcp.models import GenerationResult, WorkflowPrompt
     from comfyui_mcp.template_manager import WorkflowTemplateManager
 
 
+# Seconds generate() waits for a submitted prompt's result by default
+DEFAULT_RESULT_TIMEOUT = 600.0
+
+
+def _check_max_inflight(max_inflight: int | None) -> None:
+    """Validate an admission limit.
+
+    Args:
+        max_inflight: Limit to validate, or None for no limit
+
+    Raises:
+        ValueError: If max_inflight is less than 1
+    """
+    if max_inflight is not None and max_inflight < 1:
+        msg = f"max_inflight must be at least 1 or None, got {max_inflight}"
+        raise ValueError(msg)
+
+
 class ImageGenerator:
     """Orchestrates image generation from workflow templates.
 
@@ -48,6 +70,8 @@ class ImageGenerator:
         client: ComfyUI API client for workflow submission and monitoring
         template_manager: Manager for loading and managing workflow templates
                          (optional - can generate from direct WorkflowPrompt)
+        max_inflight: Maximum number of generations running at once, or None
+                      for no limit
 
     Example:
         >>> # With template manager
@@ -66,6 +90,7 @@ class ImageGenerator:
         self,
         client: ComfyUIClient,
         template_manager: WorkflowTemplateManager | None = None,
+        max_inflight: int | None = None,
     ) -> None:
         """Initialize the ImageGenerator.
 
@@ -73,6 +98,12 @@ class ImageGenerator:
             client: ComfyUI API client for workflow submission and result retrieval
             template_manager: Optional template manager for loading workflow templates.
                             If not provided, only direct workflow generation is supported.
+            max_inflight: Maximum number of generate() calls allowed to run at
+                          once; further calls wait for a slot. None (default)
+                          admits every call immediately.
+
+        Raises:
+            ValueError: If max_inflight is less than 1
 
         Example:
             >>> config = ComfyUIConfig(url="http://localhost:8188")
@@ -83,10 +114,66 @@ class ImageGenerator:
         self.client = client
         self.template_manager = template_manager
 
+        # Admission control: a counter guarded by a Condition (rather than a
+        # Semaphore) so the limit can be changed while calls are waiting
+        _check_max_inflight(max_inflight)
+        self._max_inflight = max_inflight
+        self._inflight = 0
+        self._admission = asyncio.Condition()
+
+    @property
+    def max_inflight(self) -> int | None:
+        """Maximum number of generations running at once (None = no limit)."""
+        return self._max_inflight
+
+    @property
+    def inflight(self) -> int:
+        """Number of generate() calls currently admitted."""
+        return self._inflight
+
+    async def set_max_inflight(self, max_inflight: int | None) -> None:
+        """Change the admission limit, waking waiting calls if it grew.
+
+        Lowering the limit never interrupts running generations; new calls
+        wait until the number in flight drops below the new limit.
+
+        Args:
+            max_inflight: New limit, or None for no limit
+
+        Raises:
+            ValueError: If max_inflight is less than 1
+
+        Example:
+            >>> # Back off while the server is overloaded
+            >>> await generator.set_max_inflight(1)
+        """
+        _check_max_inflight(max_inflight)
+        async with self._admission:
+            self._max_inflight = max_inflight
+            self._admission.notify_all()
+
+    @asynccontextmanager
+    async def _admitted(self) -> AsyncIterator[None]:
+        """Hold one admission slot for the duration of the block."""
+        async with self._admission:
+            await self._admission.wait_for(self._has_capacity)
+            self._inflight += 1
+        try:
+            yield
+        finally:
+            async with self._admission:
+                self._inflight -= 1
+                self._admission.notify(1)
+
+    def _has_capacity(self) -> bool:
+        """Return whether another generation may start now."""
+        return self._max_inflight is None or self._inflight < self._max_inflight
+
     async def generate_from_template(
         self,
         template_id: str,
         parameters: dict[str, Any] | None = None,
+        timeout: float | None = DEFAULT_RESULT_TIMEOUT,
     ) -> GenerationResult:
         """Generate images from a workflow template.
 
@@ -97,6 +184,8 @@ class ImageGenerator:
             template_id: ID (filename without extension) of the template to use
             parameters: Parameter values to substitute into the template.
                        If not provided, template defaults are used.
+            timeout: Seconds to wait for the result once the workflow is
+                     submitted (see generate())
 
         Returns:
             GenerationResult containing generated images, metadata, and timing info
@@ -106,6 +195,7 @@ class ImageGenerator:
             FileNotFoundError: If the specified template does not exist
             ValidationError: If required template parameters are missing or invalid
             ComfyUIError: If workflow submission or execution fails
+            TimeoutError: If the result is not available within timeout
 
         Example:
             >>> result = await generator.generate_from_template(
@@ -135,25 +225,36 @@ class ImageGenerator:
         workflow = template.instantiate(parameters or {})
 
         # Generate using the instantiated workflow
-        return await self.generate(workflow=workflow)
+        return await self.generate(workflow=workflow, timeout=timeout)
 
     async def generate(
         self,
         workflow: WorkflowPrompt,
+        timeout: float | None = DEFAULT_RESULT_TIMEOUT,
     ) -> GenerationResult:
         """Generate images from a workflow prompt.
 
-        Submits the workflow to ComfyUI and retrieves the generation result.
-        This method provides direct workflow execution without template instantiation.
+        Submits the workflow to ComfyUI and waits for the generation result,
+        polling the history with exponential backoff (see
+        ComfyUIClient.wait_for_result). This method provides direct workflow
+        execution without template instantiation. When max_inflight is set,
+        the call first waits for an admission slot.
 
         Args:
             workflow: WorkflowPrompt containing the complete workflow definition
+            timeout: Seconds to wait for the result once the workflow is
+                     submitted, so a prompt stuck on the server cannot hold
+                     the call (and its admission slot) forever. None waits
+                     without limit. Defaults to DEFAULT_RESULT_TIMEOUT.
 
         Returns:
             GenerationResult containing generated images, metadata, and timing info
 
         Raises:
             ComfyUIError: If workflow submission or execution fails
+            TimeoutError: If the result is not available within timeout
+            ValueError: If the prompt leaves the queue without reaching the
+                        history (e.g. it was deleted before it ran)
 
         Example:
             >>> from comfyui_mcp import WorkflowPrompt, WorkflowNode
@@ -169,13 +270,68 @@ class ImageGenerator:
             ... )
             >>> result = await generator.generate(workflow=workflow)
         """
-        # Submit workflow to ComfyUI
-        response = await self.client.submit_workflow(workflow)
+        async with self._admitted():
+            # Submit workflow to ComfyUI
+            response = await self.client.submit_workflow(workflow)
 
-        # Extract prompt ID from response
-        prompt_id: str = response["prompt_id"]
+            # Extract prompt ID from response
+            prompt_id: str = response["prompt_id"]
 
-        # Retrieve generation result from history
-        result: GenerationResult = await self.client.get_history(prompt_id)
+            # Wait for the generation result to appear in the history
+            result: GenerationResult = await self.client.wait_for_result(
+                prompt_id, timeout=timeout
+            )
 
         return result
+
+    async def generate_batch(
+        self,
+        workflows: Iterable[WorkflowPrompt],
+        max_parallel: int = 4,
+    ) -> list[GenerationResult]:
+        """Generate images for several workflows with bounded parallelism.
+
+        Runs generate() for each workflow with at most ``max_parallel`` of
+        them submitted or waiting for results at once, so ComfyUI receives
+        submissions at a steady rate instead of all at once. The generator's
+        max_inflight limit still applies on top. If any generation fails,
+        the others are cancelled and the error is raised.
+
+        Args:
+            workflows: Workflow prompts to generate
+            max_parallel: Maximum number of generations of this batch running
+                          at once (default: 4)
+
+        Returns:
+            GenerationResult for each workflow, in the same order as workflows
+
+        Raises:
+            ValueError: If max_parallel is less than 1
+            ComfyUIError: If any workflow submission or execution fails
+
+        Example:
+            >>> results = await generator.generate_batch(
+            ...     [workflow_a, workflow_b, workflow_c], max_parallel=2
+            ... )
+            >>> len(results)
+            3
+        """
+        if max_parallel < 1:
+            msg = f"max_parallel must be at least 1, got {max_parallel}"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def generate_one(workflow: WorkflowPrompt) -> GenerationResult:
+            async with semaphore:
+                return await self.generate(workflow)
+
+        tasks = [asyncio.ensure_future(generate_one(w)) for w in workflows]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Don't leave the rest of the batch running unobserved
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -6,11 +6,105 @@ nodes, and prompts used for AI image generation.
 
 from __future__ import annotations
 
+import os
+import re
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, field_validator
+from pydantic import ValidationError as PydanticValidationError
+
+from comfyui_mcp import _json
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib
+
+if TYPE_CHECKING:
+    from yarl import URL
+
+# Template parameter placeholder, e.g. {{prompt}}
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# ComfyUIConfig.from_file() results by (class, absolute path), stored with
+# the file's (mtime_ns, size) so edits to the file are picked up
+_FROM_FILE_CACHE: dict[tuple[type, str], tuple[int, int, Any]] = {}
+
+
+@lru_cache(maxsize=32)
+def _parse_url(url: str) -> URL:
+    """Parse a server URL string, reusing the result for repeated URLs.
+
+    Args:
+        url: Absolute http:// or https:// URL
+
+    Returns:
+        The parsed yarl URL
+    """
+    from yarl import URL
+
+    return URL(url)
+
+
+@lru_cache(maxsize=1024)
+def _split_placeholders(text: str) -> tuple[str, ...]:
+    """Split a string around its {{parameter_name}} placeholders.
+
+    Templates are instantiated many times with the same input strings, so
+    the split is cached per string and the regex runs once per distinct
+    string rather than on every instantiate() call. Strings are immutable,
+    so a cached split can never go stale.
+
+    Args:
+        text: String that may contain placeholders
+
+    Returns:
+        Alternating literal text (even indexes) and parameter names (odd
+        indexes); a single element if the string has no placeholder
+    """
+    return tuple(_PLACEHOLDER_RE.split(text))
+
+
+def _substitute_string(text: str, param_values: dict[str, Any]) -> Any:
+    """Substitute {{parameter_name}} placeholders in one string.
+
+    Args:
+        text: String that may contain placeholders
+        param_values: Dictionary of parameter values
+
+    Returns:
+        The parameter's value itself (preserving its type) if the whole string
+        is one placeholder, otherwise the string with every placeholder that
+        has a value replaced by its str()
+    """
+    # Most inputs contain no placeholder; skip the lookup entirely
+    if "{{" not in text:
+        return text
+
+    parts = _split_placeholders(text)
+    if len(parts) == 1:
+        return text
+
+    # Check if the entire string is a placeholder
+    if len(parts) == 3 and not parts[0] and not parts[2]:
+        value = param_values.get(parts[1])
+        if value is not None:
+            return value  # Return actual value, preserving type
+        return text  # Keep placeholder if no value
+
+    # Otherwise, do string substitution
+    pieces: list[str] = []
+    for index, part in enumerate(parts):
+        if index % 2 == 0:
+            pieces.append(part)
+            continue
+        value = param_values.get(part)
+        # Keep placeholder if no value
+        pieces.append(f"{{{{{part}}}}}" if value is None else str(value))
+    return "".join(pieces)
 
 
 class WorkflowNode(BaseModel):
@@ -95,20 +189,42 @@ class WorkflowPrompt(BaseModel):
             >>> api_data = prompt.to_api_format()
             >>> # POST to http://comfyui:8188/prompt with api_data
         """
-        # Convert nodes dict to the format ComfyUI expects
-        prompt_dict: dict[str, Any] = {}
-        for node_id, node in self.nodes.items():
-            prompt_dict[node_id] = {
-                "class_type": node.class_type,
-                "inputs": node.inputs,
-            }
+        # Convert nodes dict to the format ComfyUI expects. Built by hand
+        # rather than with model_dump(), which copies every inputs dict and
+        # measured about 4x slower for this per-submit conversion.
+        prompt_dict: dict[str, Any] = {
+            node_id: {"class_type": node.class_type, "inputs": node.inputs}
+            for node_id, node in self.nodes.items()
+        }
+
+        if self.client_id is None:
+            return {"prompt": prompt_dict}
+        return {"prompt": prompt_dict, "client_id": self.client_id}
 
-        result: dict[str, Any] = {"prompt": prompt_dict}
+    def to_api_bytes(self) -> bytes:
+        """Serialize the workflow straight to a ComfyUI /prompt request body.
+
+        Produces the same document as encoding to_api_format() as compact
+        JSON, but hands each node's field dict (exactly ``class_type`` and
+        ``inputs``, since extra fields are forbidden) to the encoder as-is
+        instead of building a new dict per node.
+
+        Returns:
+            Compact UTF-8 JSON for POST /prompt
+
+        Example:
+            >>> prompt = WorkflowPrompt(nodes={"1": WorkflowNode(...)})
+            >>> body = prompt.to_api_bytes()
+            >>> # POST to http://comfyui:8188/prompt with data=body
+        """
+        payload: dict[str, Any] = {
+            "prompt": {node_id: vars(node) for node_id, node in self.nodes.items()}
+        }
 
         if self.client_id is not None:
-            result["client_id"] = self.client_id
+            payload["client_id"] = self.client_id
 
-        return result
+        return _json.dumps_bytes(payload)
 
     def get_seed(self) -> int | None:
         """Extract the seed value from the first KSampler node.
@@ -252,6 +368,11 @@ class ComfyUIConfig(BaseModel):
         api_key: Optional API key for authentication (min 8 chars if provided)
         timeout: Request timeout in seconds (1.0 - 3600.0, default: 120.0)
         output_dir: Optional directory path for saving generated images
+        connection_limit: Maximum simultaneous connections (0 = no limit)
+        per_host_limit: Maximum simultaneous connections per host (0 = no limit)
+        keepalive_timeout: Seconds an idle keep-alive connection stays pooled
+        share_session: Share one HTTP session between clients with the same
+            settings instead of creating one per client
 
     Validation Rules:
         - URL: Must start with http:// or https://, trailing slashes removed
@@ -287,6 +408,25 @@ class ComfyUIConfig(BaseModel):
         default=None,
         description="Optional directory path for saving generated images",
     )
+    connection_limit: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum simultaneous connections (0 = no limit)",
+    )
+    per_host_limit: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum simultaneous connections per host (0 = no limit)",
+    )
+    keepalive_timeout: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Seconds an idle keep-alive connection stays pooled",
+    )
+    share_session: bool = Field(
+        default=False,
+        description="Share one HTTP session between clients with the same settings",
+    )
 
     model_config = {"extra": "forbid", "frozen": True}
 
@@ -326,8 +466,10 @@ class ComfyUIConfig(BaseModel):
             >>> validate_api_key("short")  # Raises ValueError: < 8 chars
         """
         if v is not None:
-            # Check for empty or whitespace-only
-            if not v or not v.strip():
+            # Check for empty or whitespace-only; a value can only be
+            # whitespace-only if it starts with whitespace, so clean values
+            # skip the strip() copy
+            if not v or (v[0].isspace() and not v.strip()):
                 msg = "API key must not be empty or whitespace-only"
                 raise ValueError(msg)
 
@@ -387,13 +529,58 @@ class ComfyUIConfig(BaseModel):
             >>> validate_output_dir("   ")  # Raises ValueError
         """
         if v is not None:
-            # Check for empty or whitespace-only
-            if not v or not v.strip():
+            # Check for empty or whitespace-only (see validate_api_key)
+            if not v or (v[0].isspace() and not v.strip()):
                 msg = "Output directory must not be empty or whitespace-only"
                 raise ValueError(msg)
 
         return v
 
+    @property
+    def base_url(self) -> URL:
+        """The server URL parsed into a yarl URL.
+
+        Parsing happens once per distinct URL string and is shared by every
+        config (and copy) with that URL, so clients can derive endpoint URLs
+        with yarl's ``/`` operator without re-parsing the server address.
+
+        Returns:
+            Parsed server URL
+
+        Example:
+            >>> config = ComfyUIConfig(url="http://127.0.0.1:8188")
+            >>> str(config.base_url / "queue")
+            'http://127.0.0.1:8188/queue'
+        """
+        return _parse_url(self.url)
+
+    def with_url(self, url: str) -> ComfyUIConfig:
+        """Return a copy of this configuration pointing at a different server.
+
+        Only the new URL is validated (scheme check and trailing-slash
+        normalization); the remaining fields were validated when this
+        instance was created and are copied as-is.
+
+        Args:
+            url: Replacement ComfyUI server URL
+
+        Returns:
+            New ComfyUIConfig with the URL replaced
+
+        Raises:
+            ValidationError: If url is not an http:// or https:// URL
+
+        Example:
+            >>> config = ComfyUIConfig(url="http://localhost:8188", timeout=60.0)
+            >>> remote = config.with_url("http://192.168.1.100:8188/")
+            >>> assert remote.url == "http://192.168.1.100:8188"
+            >>> assert remote.timeout == 60.0
+        """
+        config = self.model_copy()
+        # Runs the url field's constraints and validators on the copy only
+        type(self).__pydantic_validator__.validate_assignment(config, "url", url)
+        return config
+
     @classmethod
     def from_env(cls) -> ComfyUIConfig:
         """Load configuration from environment variables.
@@ -422,8 +609,6 @@ class ComfyUIConfig(BaseModel):
             >>> assert config.url == "http://localhost:8188"
             >>> assert config.timeout == 60.0
         """
-        import os
-
         # Required: COMFYUI_URL
         url = os.environ.get("COMFYUI_URL", "").strip()
         if not url:
@@ -468,6 +653,9 @@ class ComfyUIConfig(BaseModel):
         Returns:
             ComfyUIConfig instance with values loaded from the configuration file.
             Any fields not specified in the file use their default values.
+            Configs are frozen, so while a file's modification time and size
+            are unchanged, repeated calls return the same instance without
+            re-reading it.
 
         Raises:
             FileNotFoundError: If config_path is provided but doesn't exist, or
@@ -488,14 +676,6 @@ class ComfyUIConfig(BaseModel):
             >>> print(config.timeout)
             120.0
         """
-        import os
-        from pathlib import Path
-
-        try:
-            import tomllib  # Python 3.11+
-        except ImportError:
-            import tomli as tomllib
-
         # Import here to avoid circular dependency
         from comfyui_mcp.config import find_config_file
 
@@ -515,14 +695,22 @@ class ComfyUIConfig(BaseModel):
         if isinstance(config_path, str):
             config_path = Path(config_path)
 
-        # Check file exists
-        if not config_path.exists():
+        # Check file exists, reusing the previous result if it is unchanged
+        try:
+            stat = config_path.stat()
+        except OSError as e:
             msg = f"Configuration file not found: {config_path}"
-            raise FileNotFoundError(msg)
+            raise FileNotFoundError(msg) from e
+
+        cache_key = (cls, str(config_path.absolute()))
+        file_state = (stat.st_mtime_ns, stat.st_size)
+        cached = _FROM_FILE_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == file_state:
+            config: ComfyUIConfig = cached[2]
+            return config
 
         # Load TOML file
-        with open(config_path, "rb") as f:
-            toml_data = tomllib.load(f)
+        toml_data = tomllib.loads(config_path.read_text(encoding="utf-8"))
 
         # Check for [comfyui] section
         if "comfyui" not in toml_data:
@@ -542,12 +730,14 @@ class ComfyUIConfig(BaseModel):
         output_dir = config_section.get("output_dir")
 
         # Create config instance (validators will run automatically)
-        return cls(
+        config = cls(
             url=url,
             api_key=api_key,
             timeout=float(timeout),
             output_dir=output_dir,
         )
+        _FROM_FILE_CACHE[cache_key] = (*file_state, config)
+        return config
 
 
 class WorkflowState(str, Enum):
@@ -726,10 +916,6 @@ class WorkflowTemplate(BaseModel):
             >>> template = WorkflowTemplate(...)
             >>> workflow = template.instantiate({"prompt": "a warrior", "seed": 123})
         """
-        import copy
-
-        from pydantic import ValidationError as PydanticValidationError
-
         # Build parameter values (only use defaults for parameters not explicitly provided)
         param_values: dict[str, Any] = {}
         provided_params = params if params is not None else {}
@@ -788,15 +974,13 @@ class WorkflowTemplate(BaseModel):
                 # Keep unknown parameters as-is
                 validated_params[param_name] = value
 
-        # Deep copy nodes to avoid modifying the template
+        # Build new nodes; the template itself is never modified
         instantiated_nodes: dict[str, WorkflowNode] = {}
 
         for node_id, node in self.nodes.items():
-            # Deep copy the node's inputs
-            node_inputs = copy.deepcopy(node.inputs)
-
-            # Substitute parameters in inputs
-            node_inputs = self._substitute_parameters(node_inputs, validated_params)
+            # Substitution rebuilds every dict and list it descends into, so
+            # the result shares no mutable containers with the template
+            node_inputs = self._substitute_parameters(node.inputs, validated_params)
 
             # Create new node with substituted inputs
             instantiated_nodes[node_id] = WorkflowNode(
@@ -806,50 +990,55 @@ class WorkflowTemplate(BaseModel):
         return WorkflowPrompt(nodes=instantiated_nodes)
 
     def _substitute_parameters(self, obj: Any, param_values: dict[str, Any]) -> Any:
-        """Recursively substitute parameter placeholders in an object.
+        """Substitute parameter placeholders throughout an object.
+
+        Nested dicts and lists are walked with an explicit work list rather
+        than one recursive call per value: each container is copied, pushed,
+        and its copy then filled in place.
 
         Args:
             obj: Object to process (can be dict, list, str, or primitive)
             param_values: Dictionary of parameter values
 
         Returns:
-            Object with all {{parameter_name}} placeholders replaced
+            Object with all {{parameter_name}} placeholders replaced. Dicts and
+            lists are always returned as new containers; other values are
+            returned as-is.
         """
-        import re
-
         if isinstance(obj, str):
-            # Check if the entire string is a placeholder
-            match = re.fullmatch(r"\{\{(\w+)\}\}", obj)
-            if match:
-                param_name = match.group(1)
-                value = param_values.get(param_name)
-                if value is not None:
-                    return value  # Return actual value, preserving type
-                return obj  # Keep placeholder if no value
-
-            # Otherwise, do string substitution
-            def replacer(match: re.Match[str]) -> str:
-                param_name = match.group(1)
-                value = param_values.get(param_name)
-                if value is None:
-                    return match.group(0)  # Keep placeholder if no value
-                return str(value)
-
-            return re.sub(r"\{\{(\w+)\}\}", replacer, obj)
-
-        elif isinstance(obj, dict):
-            return {
-                key: self._substitute_parameters(val, param_values)
-                for key, val in obj.items()
-            }
+            return _substitute_string(obj, param_values)
 
+        if isinstance(obj, dict):
+            root: dict[Any, Any] | list[Any] = dict(obj)
         elif isinstance(obj, list):
-            return [self._substitute_parameters(item, param_values) for item in obj]
-
+            root = list(obj)
         else:
             # Return primitives as-is
             return obj
 
+        # Only copies made here are ever modified, never the template's own
+        # containers
+        pending: list[dict[Any, Any] | list[Any]] = [root]
+        while pending:
+            container = pending.pop()
+            items = (
+                container.items()
+                if isinstance(container, dict)
+                else enumerate(container)
+            )
+            for key, value in items:
+                if isinstance(value, str):
+                    if "{{" in value:
+                        container[key] = _substitute_string(value, param_values)
+                elif isinstance(value, dict):
+                    container[key] = child = dict(value)
+                    pending.append(child)
+                elif isinstance(value, list):
+                    container[key] = child = list(value)
+                    pending.append(child)
+
+        return root
+
     def _validate_and_coerce_type(
         self, param_name: str, value: Any, expected_type: str
     ) -> Any:
@@ -951,35 +1140,16 @@ class WorkflowTemplate(BaseModel):
             >>> template = WorkflowTemplate(...)
             >>> template.to_file("workflows/my-template.json")
         """
-        import json
-
         if isinstance(file_path, str):
             file_path = Path(file_path)
 
-        # Convert to dict format for JSON serialization
-        data = {
-            "name": self.name,
-            "description": self.description,
-            "category": self.category,
-            "parameters": {
-                param_name: {
-                    "name": param.name,
-                    "description": param.description,
-                    "type": param.type,
-                    "default": param.default,
-                    "required": param.required,
-                }
-                for param_name, param in self.parameters.items()
-            },
-            "nodes": {
-                node_id: {"class_type": node.class_type, "inputs": node.inputs}
-                for node_id, node in self.nodes.items()
-            },
-        }
+        # model_dump() emits exactly the file format: every field, in
+        # declaration order, with parameters and nodes as plain dicts
+        data = self.model_dump()
 
-        # Write with pretty printing (indent=2)
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write with pretty printing (indent=2). The bytes go straight to the
+        # file, so the document is never held as both str and encoded bytes
+        file_path.write_bytes(_json.dumps_bytes(data, indent=True))
 
     @classmethod
     def from_file(cls, file_path: Path | str) -> WorkflowTemplate:
@@ -1005,8 +1175,6 @@ class WorkflowTemplate(BaseModel):
             >>> print(template.name)
             Character Portrait Generator
         """
-        import json
-
         if isinstance(file_path, str):
             file_path = Path(file_path)
 
@@ -1014,45 +1182,24 @@ class WorkflowTemplate(BaseModel):
             msg = f"Template file not found: {file_path}"
             raise FileNotFoundError(msg)
 
-        with open(file_path) as f:
-            data = json.load(f)
-
-        # Convert parameters from dict format to TemplateParameter objects
-        parameters = {}
-        for param_name, param_data in data.get("parameters", {}).items():
-            parameters[param_name] = TemplateParameter(**param_data)
-
-        # Convert nodes from dict format to WorkflowNode objects
-        nodes = {}
-        for node_id, node_data in data.get("nodes", {}).items():
-            nodes[node_id] = WorkflowNode(**node_data)
+        raw = file_path.read_bytes()
 
-        # Create and return WorkflowTemplate instance
-        # Let Pydantic handle validation of required fields
+        # Well-formed files are parsed and validated by pydantic-core in one
+        # pass, without building an intermediate Python dict
         try:
-            return cls(
-                name=data["name"],
-                description=data["description"],
-                category=data.get("category"),
-                parameters=parameters,
-                nodes=nodes,
-            )
-        except KeyError as e:
-            from pydantic import ValidationError as PydanticValidationError
-
-            # Convert KeyError to ValidationError for missing required fields
-            msg = f"Missing required field: {e}"
-            raise PydanticValidationError.from_exception_data(
-                "WorkflowTemplate",
-                [
-                    {  # type: ignore[typeddict-unknown-key]
-                        "type": "missing",
-                        "loc": (str(e).strip("'"),),
-                        "msg": "Field required",
-                        "input": data,
-                    }
-                ],
-            ) from e
+            return cls.model_validate_json(raw)
+        except PydanticValidationError:
+            pass
+
+        # Otherwise decode first, so invalid JSON raises JSONDecodeError, and
+        # validate the whole document in one pass. Unknown top-level keys are
+        # ignored and missing parameters/nodes default to empty, as template
+        # files have always allowed.
+        data = _json.loads(raw)
+        fields = {key: data[key] for key in cls.model_fields if key in data}
+        fields.setdefault("parameters", {})
+        fields.setdefault("nodes", {})
+        return cls.model_validate(fields)
 
 
 __all__ = [
@@ -31,7 +31,7 @@ from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
 from comfyui_mcp.comfyui_client import ComfyUIClient
-from comfyui_mcp.config import load_config
+from comfyui_mcp.config import default_config, load_config
 from comfyui_mcp.image_generator import ImageGenerator
 from comfyui_mcp.models import ComfyUIConfig
 from comfyui_mcp.template_manager import WorkflowTemplateManager
@@ -619,18 +619,13 @@ def main() -> None:
 
         # Override with command-line arguments
         if args.comfyui_url:
-            # Create new config with updated URL
-            config = ComfyUIConfig(
-                url=args.comfyui_url,
-                api_key=config.api_key,
-                timeout=config.timeout,
-                output_dir=config.output_dir,
-            )
+            # Copy the loaded config with only the URL replaced (and validated)
+            config = config.with_url(args.comfyui_url)
 
     except Exception as e:
         print(f"Error loading configuration: {e}", file=sys.stderr)
         print("Using default configuration...", file=sys.stderr)
-        config = ComfyUIConfig(url="http://localhost:8188")
+        config = default_config()
 
     # Create server
     template_dir = args.template_dir if args.template_dir else None
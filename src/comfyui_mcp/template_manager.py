@@ -24,11 +24,33 @@ Example:
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
+from typing import NamedTuple
 
+from comfyui_mcp import _json
+from comfyui_mcp.config import write_cache_file
 from comfyui_mcp.models import WorkflowTemplate
 
 
+class TemplateSummary(NamedTuple):
+    """Lightweight description of a template, used for listings.
+
+    Attributes:
+        template_id: Template identifier (filename without .json extension)
+        name: Human-readable template name
+        description: Template description
+        category: Template category, or None if uncategorized
+        parameter_count: Number of parameters the template accepts
+    """
+
+    template_id: str
+    name: str
+    description: str
+    category: str | None
+    parameter_count: int
+
+
 class WorkflowTemplateManager:
     """Manages a collection of workflow templates from a directory.
 
@@ -38,6 +60,7 @@ class WorkflowTemplateManager:
 
     Attributes:
         template_dir: Path to the directory containing template files
+        cache_dir: Directory for the on-disk summary index, or None to disable it
         _templates: Internal cache of loaded templates (dict[template_id, WorkflowTemplate])
 
     Example:
@@ -55,12 +78,15 @@ class WorkflowTemplateManager:
         >>> character_templates = manager.list_templates_by_category("character")
     """
 
-    def __init__(self, template_dir: Path | str) -> None:
+    def __init__(self, template_dir: Path | str, cache_dir: Path | None = None) -> None:
         """Initialize the template manager.
 
         Args:
             template_dir: Path to directory containing template JSON files.
                          Can be a Path object or string path.
+            cache_dir: Optional directory in which to persist the template
+                      summary index (see get_template_summaries()). When None,
+                      summaries are always computed from the template files.
 
         Raises:
             FileNotFoundError: If template_dir doesn't exist
@@ -84,6 +110,7 @@ class WorkflowTemplateManager:
             raise ValueError(msg)
 
         self.template_dir: Path = template_dir
+        self.cache_dir: Path | None = cache_dir
         self._templates: dict[str, WorkflowTemplate] = {}
 
     def list_templates(self) -> list[str]:
@@ -198,6 +225,79 @@ class WorkflowTemplateManager:
         # Return copy of cache
         return dict(self._templates)
 
+    def get_template_summaries(self) -> list[TemplateSummary]:
+        """Return a summary of every template, sorted by template ID.
+
+        When the manager has a cache_dir, summaries are persisted in an index
+        file there and reused as long as no template file was added, removed
+        or modified (compared by name, mtime and size). A warm index needs only
+        a stat of each file instead of parsing every template.
+
+        Returns:
+            List of TemplateSummary tuples, sorted by template ID
+
+        Raises:
+            ValidationError: If a template file contains invalid data
+            JSONDecodeError: If a template file contains invalid JSON
+
+        Example:
+            >>> manager = WorkflowTemplateManager("workflows/", cache_dir=Path(".cache"))
+            >>> for summary in manager.get_template_summaries():
+            ...     print(f"{summary.template_id}: {summary.name}")
+        """
+        if self.cache_dir is None:
+            return self._build_summaries()
+
+        fingerprint = [
+            [path.name, stat.st_mtime_ns, stat.st_size]
+            for path in sorted(self.template_dir.glob("*.json"))
+            for stat in (path.stat(),)
+        ]
+        index_path = self._index_cache_path(self.cache_dir)
+
+        try:
+            index = _json.loads(index_path.read_bytes())
+            if index["files"] == fingerprint:
+                return [TemplateSummary(*entry) for entry in index["summaries"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, corrupt or stale index is rebuilt below
+
+        summaries = self._build_summaries()
+        index = {"files": fingerprint, "summaries": [list(s) for s in summaries]}
+        write_cache_file(index_path, _json.dumps(index))
+        return summaries
+
+    def _build_summaries(self) -> list[TemplateSummary]:
+        """Load every template and summarize it.
+
+        Returns:
+            List of TemplateSummary tuples, sorted by template ID
+        """
+        return [
+            TemplateSummary(
+                template_id=template_id,
+                name=template.name,
+                description=template.description,
+                category=template.category,
+                parameter_count=len(template.parameters),
+            )
+            for template_id, template in sorted(self.get_all_templates().items())
+        ]
+
+    def _index_cache_path(self, cache_dir: Path) -> Path:
+        """Return the summary index file for this template directory.
+
+        Args:
+            cache_dir: Directory holding index files
+
+        Returns:
+            Path inside cache_dir, unique per resolved template directory
+        """
+        digest = hashlib.blake2b(
+            str(self.template_dir.resolve()).encode(), digest_size=8
+        ).hexdigest()
+        return cache_dir / f"templates-{digest}.idx.json"
+
     def list_templates_by_category(self, category: str | None) -> list[str]:
         """List templates filtered by category.
 
@@ -259,4 +359,4 @@ class WorkflowTemplateManager:
         self._templates.clear()
 
 
-__all__ = ["WorkflowTemplateManager"]
+__all__ = ["TemplateSummary", "WorkflowTemplateManager"]
@@ -0,0 +1,26 @@
+"""Shared pytest fixtures for the comfyui_mcp test suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from comfyui_mcp.config import clear_config_file_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point XDG_CACHE_HOME at a per-test directory.
+
+    Keeps tests from reading or writing the user's real comfyui-mcp cache.
+    """
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_file_lookup() -> None:
+    """Forget config file lookups memoized by earlier tests."""
+    clear_config_file_cache()
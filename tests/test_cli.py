@@ -12,11 +12,17 @@ Tests the Click-based command-line interface including:
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
+import comfyui_mcp
 from comfyui_mcp.cli import cli
 from comfyui_mcp.models import ComfyUIConfig
 
@@ -48,6 +54,173 @@ class TestCLICommandGroup:
             c.isdigit() for c in result.output
         )
 
+    @patch("comfyui_mcp.cli.load_config")
+    def test_cli_version_option_is_eager(self, mock_load_config: MagicMock) -> None:
+        """Test that --version prints and exits before loading configuration."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--version", "list-templates"])
+
+        assert result.exit_code == 0
+        assert result.output == "comfyui-mcp, version 0.1.0\n"
+        mock_load_config.assert_not_called()
+
+
+class TestConsoleEntryPoint:
+    """Tests for the comfyui-mcp console script entry point."""
+
+    def test_version_fast_path(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that --version is answered by the entry point itself."""
+        from comfyui_mcp.__main__ import main
+
+        monkeypatch.setattr(sys, "argv", ["comfyui-mcp", "--version"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == "comfyui-mcp, version 0.1.0\n"
+
+    def test_version_fast_path_skips_heavy_imports(self) -> None:
+        """Test that --version does not import Click or the CLI module."""
+        code = (
+            "import sys; sys.argv = ['comfyui-mcp', '--version']\n"
+            "from comfyui_mcp.__main__ import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print([m for m in ('click', 'comfyui_mcp.cli', 'aiohttp') "
+            "if m in sys.modules])\n"
+        )
+        src_dir = str(Path(comfyui_mcp.__file__).resolve().parent.parent)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+
+        assert result.stdout.splitlines()[-1] == "[]"
+
+    def test_other_arguments_delegate_to_click(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that non-fast-path invocations are handed to cli.main."""
+        from comfyui_mcp.__main__ import main
+
+        monkeypatch.setattr(sys, "argv", ["comfyui-mcp", "list-templates"])
+
+        with patch("comfyui_mcp.cli.main") as mock_cli_main:
+            main()
+
+        mock_cli_main.assert_called_once_with()
+
+    def test_help_cache_is_up_to_date(self) -> None:
+        """Test that the pre-rendered help matches the current CLI."""
+        from comfyui_mcp.cli import HELP_CACHE_FILENAME, render_help
+
+        cache_file = Path(comfyui_mcp.__file__).parent / HELP_CACHE_FILENAME
+
+        assert cache_file.read_text(encoding="utf-8") == render_help(), (
+            "Help cache is stale; run: python tools/snapshot_help.py"
+        )
+
+    def test_help_fast_path(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a bare --help prints the pre-rendered text."""
+        from comfyui_mcp.__main__ import main
+        from comfyui_mcp.cli import render_help
+
+        monkeypatch.setattr(sys, "argv", ["comfyui-mcp", "--help"])
+        monkeypatch.setenv("COLUMNS", "120")
+
+        with patch("comfyui_mcp.cli.main") as mock_cli_main:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == render_help()
+        mock_cli_main.assert_not_called()
+
+    def test_help_fast_path_matches_click_output(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the cached help is what Click prints on a wide terminal."""
+        from comfyui_mcp.__main__ import main as entry_main
+        from comfyui_mcp.cli import main as cli_main
+
+        monkeypatch.setattr(sys, "argv", ["comfyui-mcp", "--help"])
+        monkeypatch.setenv("COLUMNS", "120")
+
+        with pytest.raises(SystemExit):
+            entry_main()
+        cached = capsys.readouterr().out
+
+        with pytest.raises(SystemExit):
+            cli_main()
+        rendered = capsys.readouterr().out
+
+        assert cached == rendered
+
+    def test_help_on_narrow_terminal_delegates_to_click(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that terminals under 80 columns get Click's own layout."""
+        from comfyui_mcp.__main__ import main
+
+        monkeypatch.setattr(sys, "argv", ["comfyui-mcp", "--help"])
+        monkeypatch.setenv("COLUMNS", "60")
+
+        with patch("comfyui_mcp.cli.main") as mock_cli_main:
+            main()
+
+        mock_cli_main.assert_called_once_with()
+
+    def test_help_fast_path_skips_heavy_imports(self) -> None:
+        """Test that a bare --help does not import Click or the CLI module."""
+        code = (
+            "import sys; sys.argv = ['comfyui-mcp', '--help']\n"
+            "from comfyui_mcp.__main__ import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print([m for m in ('click', 'comfyui_mcp.cli', 'aiohttp') "
+            "if m in sys.modules])\n"
+        )
+        src_dir = str(Path(comfyui_mcp.__file__).resolve().parent.parent)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir, "COLUMNS": "120"},
+        )
+
+        assert result.stdout.splitlines()[-1] == "[]"
+
+    def test_cli_module_defers_client_imports(self) -> None:
+        """Test that importing the CLI does not load the HTTP client stack."""
+        code = (
+            "import sys, comfyui_mcp.cli; "
+            "print([m for m in ('asyncio', 'aiohttp', 'comfyui_mcp.comfyui_client', "
+            "'comfyui_mcp.template_manager') if m in sys.modules])"
+        )
+        src_dir = str(Path(comfyui_mcp.__file__).resolve().parent.parent)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+
+        assert result.stdout.splitlines()[-1] == "[]"
+
 
 class TestGlobalOptions:
     """Tests for global CLI options."""
@@ -133,6 +306,64 @@ class TestConfigurationLoading:
 
         assert result.exit_code == 0
 
+    @patch("comfyui_mcp.cli.load_config")
+    def test_cli_falls_back_to_shared_default_config(
+        self, mock_load_config: MagicMock
+    ) -> None:
+        """Test that a config load error falls back to default_config()."""
+        from comfyui_mcp.config import default_config
+
+        mock_load_config.side_effect = Exception("Config load failed")
+
+        @cli.command("show-config")
+        @click.pass_context
+        def show_config(ctx: click.Context) -> None:
+            assert ctx.obj["config"] is default_config()
+
+        try:
+            runner = CliRunner()
+            result = runner.invoke(cli, ["show-config"])
+        finally:
+            cli.commands.pop("show-config")
+
+        assert result.exit_code == 0
+
+    @patch("comfyui_mcp.cli.load_config")
+    def test_cli_uses_config_cache_by_default(
+        self, mock_load_config: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that subcommands load configuration through the cache."""
+        mock_load_config.return_value = ComfyUIConfig(url="http://test:8188")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--template-dir", str(tmp_path / "none"), "list-templates"]
+        )
+
+        assert result.exit_code == 0
+        mock_load_config.assert_called_once_with(use_cache=True)
+
+    @patch("comfyui_mcp.cli.load_config")
+    def test_no_config_cache_flag_disables_cache(
+        self, mock_load_config: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that --no-config-cache bypasses the configuration cache."""
+        mock_load_config.return_value = ComfyUIConfig(url="http://test:8188")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            [
+                "--no-config-cache",
+                "--template-dir",
+                str(tmp_path / "none"),
+                "list-templates",
+            ],
+        )
+
+        assert result.exit_code == 0
+        mock_load_config.assert_called_once_with(use_cache=False)
+
 
 class TestContextManagement:
     """Tests for Click context object management."""
@@ -198,6 +429,71 @@ class TestCommandExtensibility:
         # Should have a commands section (even if empty for now)
         # Click groups typically show "Commands:" in help text
 
+    def test_cli_lists_lazy_commands(self) -> None:
+        """Test that lazily loaded subcommands appear in help output."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ("test-connection", "generate", "list-templates"):
+            assert name in result.output
+
+    def test_get_command_resolves_lazy_command(self) -> None:
+        """Test that get_command imports and returns the subcommand."""
+        ctx = click.Context(cli)
+
+        command = cli.get_command(ctx, "list-templates")
+
+        assert isinstance(command, click.Command)
+        assert command.name == "list-templates"
+
+    def test_get_command_unknown_returns_none(self) -> None:
+        """Test that unknown subcommand names resolve to None."""
+        ctx = click.Context(cli)
+
+        assert cli.get_command(ctx, "does-not-exist") is None
+
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            ([], "AI-powered image generation"),
+            (["test-connection"], "Exit codes:"),
+            (["generate"], "TEMPLATE_ID argument"),
+            (["list-templates"], "Output Formats:"),
+        ],
+    )
+    def test_help_survives_docstring_stripping(
+        self, args: list[str], expected: str
+    ) -> None:
+        """Test that --help text is complete under python -OO."""
+        src_dir = str(Path(comfyui_mcp.__file__).resolve().parent.parent)
+        result = subprocess.run(
+            [sys.executable, "-OO", "-m", "comfyui_mcp.cli", *args, "--help"],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+
+        assert expected in result.stdout
+
+    def test_subcommand_modules_not_imported_with_cli(self) -> None:
+        """Test that importing the CLI leaves subcommand modules unloaded."""
+        code = (
+            "import sys, comfyui_mcp.cli; "
+            "print([m for m in sys.modules if m.startswith('comfyui_mcp._cmd_')])"
+        )
+        src_dir = str(Path(comfyui_mcp.__file__).resolve().parent.parent)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+
+        assert result.stdout.splitlines()[-1] == "[]"
+
 
 class TestCLIIntegration:
     """Integration tests for CLI with configuration system."""
@@ -262,7 +558,7 @@ class TestTestConnectionCommand:
         assert result.exit_code == 0
         assert "test-connection" in result.output.lower()
 
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_test_connection_success(self, mock_client_class: MagicMock) -> None:
         """Test test-connection command with successful connection."""
         # Setup mock
@@ -285,7 +581,7 @@ class TestTestConnectionCommand:
             "success" in result.output.lower() or "connected" in result.output.lower()
         )
 
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_test_connection_failure(self, mock_client_class: MagicMock) -> None:
         """Test test-connection command with failed connection."""
         # Setup mock
@@ -310,7 +606,7 @@ class TestTestConnectionCommand:
             or "refused" in result.output.lower()
         )
 
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_test_connection_with_custom_url(
         self, mock_client_class: MagicMock
     ) -> None:
@@ -336,7 +632,7 @@ class TestTestConnectionCommand:
         # Verify client was created with correct URL
         assert mock_client_class.called
 
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_test_connection_shows_url(self, mock_client_class: MagicMock) -> None:
         """Test that test-connection shows the URL being tested."""
         # Setup mock
@@ -357,7 +653,7 @@ class TestTestConnectionCommand:
         assert result.exit_code == 0
         assert "localhost" in result.output or "8188" in result.output
 
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_test_connection_with_verbose(self, mock_client_class: MagicMock) -> None:
         """Test test-connection command with --verbose flag."""
         # Setup mock
@@ -378,7 +674,7 @@ class TestTestConnectionCommand:
         # Should show more detailed output
         assert result.exit_code == 0
 
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_test_connection_handles_exception(
         self, mock_client_class: MagicMock
     ) -> None:
@@ -395,7 +691,23 @@ class TestTestConnectionCommand:
         assert result.exit_code in [0, 1]
         assert "error" in result.output.lower() or "fail" in result.output.lower()
 
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
+    def test_test_connection_verbose_exception_shows_traceback(
+        self, mock_client_class: MagicMock
+    ) -> None:
+        """Test that --verbose prints the traceback of unexpected errors."""
+        mock_client = MagicMock()
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client.health_check = AsyncMock(side_effect=Exception("Network error"))
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--verbose", "test-connection"])
+
+        assert result.exit_code == 1
+        assert "Traceback (most recent call last)" in result.output
+        assert "Exception: Network error" in result.output
+
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_test_connection_exit_code_on_failure(
         self, mock_client_class: MagicMock
     ) -> None:
@@ -426,8 +738,8 @@ class TestGenerateCommand:
         assert result.exit_code == 0
         assert "generate" in result.output.lower()
 
-    @patch("comfyui_mcp.cli.ImageGenerator")
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.image_generator.ImageGenerator")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_generate_with_template_id(
         self,
         mock_client_class: MagicMock,
@@ -473,8 +785,8 @@ class TestGenerateCommand:
         assert result.exit_code == 0
         assert "test-123" in result.output or "output.png" in result.output
 
-    @patch("comfyui_mcp.cli.ImageGenerator")
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.image_generator.ImageGenerator")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_generate_with_parameters(
         self,
         mock_client_class: MagicMock,
@@ -529,8 +841,8 @@ class TestGenerateCommand:
         # Should succeed and pass parameters
         assert result.exit_code == 0
 
-    @patch("comfyui_mcp.cli.ImageGenerator")
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.image_generator.ImageGenerator")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_generate_with_output_dir(
         self,
         mock_client_class: MagicMock,
@@ -579,8 +891,8 @@ class TestGenerateCommand:
         # Should succeed
         assert result.exit_code == 0
 
-    @patch("comfyui_mcp.cli.ImageGenerator")
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.image_generator.ImageGenerator")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_generate_missing_template(
         self,
         mock_client_class: MagicMock,
@@ -613,8 +925,8 @@ class TestGenerateCommand:
         assert result.exit_code == 1
         assert "error" in result.output.lower() or "not found" in result.output.lower()
 
-    @patch("comfyui_mcp.cli.ImageGenerator")
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.image_generator.ImageGenerator")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_generate_shows_progress(
         self,
         mock_client_class: MagicMock,
@@ -665,8 +977,8 @@ class TestGenerateCommand:
             for word in ["generating", "completed", "success", "generated"]
         )
 
-    @patch("comfyui_mcp.cli.ImageGenerator")
-    @patch("comfyui_mcp.cli.ComfyUIClient")
+    @patch("comfyui_mcp.image_generator.ImageGenerator")
+    @patch("comfyui_mcp.comfyui_client.ComfyUIClient")
     def test_generate_with_verbose_output(
         self,
         mock_client_class: MagicMock,
@@ -860,3 +1172,35 @@ class TestListTemplatesCommand:
         output_data = json.loads(result.output)
         assert isinstance(output_data, list)
         assert len(output_data) == 1
+
+    def test_list_templates_detailed_uses_summary_index(
+        self, tmp_path: Path, isolated_cache_dir: Path
+    ) -> None:
+        """Test that --detailed output is built from the cached summary index."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        template_data = {
+            "name": "Test Template",
+            "description": "A test template",
+            "category": "test",
+            "parameters": {
+                "prompt": {
+                    "name": "prompt",
+                    "description": "Prompt",
+                    "type": "string",
+                    "default": "",
+                }
+            },
+            "nodes": {},
+        }
+        (template_dir / "test-template.json").write_text(json.dumps(template_data))
+
+        runner = CliRunner()
+        args = ["--template-dir", str(template_dir), "list-templates", "--detailed"]
+        first = runner.invoke(cli, args)
+        second = runner.invoke(cli, args)
+
+        assert first.exit_code == 0
+        assert second.output == first.output
+        assert "Parameters:  1" in second.output
+        assert list((isolated_cache_dir / "comfyui-mcp").glob("templates-*.idx.json"))
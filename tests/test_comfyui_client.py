@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import warnings
+from unittest.mock import patch
+
 import pytest
-from aiohttp import ClientConnectorError, ClientResponseError, ClientSession
+from aiohttp import (
+    ClientConnectorError,
+    ClientResponseError,
+    ClientSession,
+    TCPConnector,
+)
 
 from comfyui_mcp.comfyui_client import ComfyUIClient
 from comfyui_mcp.models import (
@@ -51,6 +60,17 @@ class TestComfyUIClientInitialization:
 
         assert client.config.output_dir == "/path/to/output"
 
+    def test_endpoint_urls_precomputed(self):
+        """Test that endpoint URLs are parsed once from the configured URL."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188/comfy/")
+        client = ComfyUIClient(config)
+
+        assert str(client._queue_url) == "http://127.0.0.1:8188/comfy/queue"
+        assert str(client._prompt_url) == "http://127.0.0.1:8188/comfy/prompt"
+        assert str(client._history_url) == "http://127.0.0.1:8188/comfy/history"
+        assert str(client._view_url) == "http://127.0.0.1:8188/comfy/view"
+        assert str(client._interrupt_url) == "http://127.0.0.1:8188/comfy/interrupt"
+
 
 class TestComfyUIClientSessionManagement:
     """Test ComfyUIClient aiohttp session management."""
@@ -82,6 +102,23 @@ class TestComfyUIClientSessionManagement:
         # Clean up
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_first_access_creates_one_session(self):
+        """Test that coroutines racing on first access share one session."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client = ComfyUIClient(config)
+
+        async def get_session():
+            await asyncio.sleep(0)
+            return client.session
+
+        sessions = await asyncio.gather(*(get_session() for _ in range(20)))
+
+        assert len({id(session) for session in sessions}) == 1
+
+        # Clean up
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_close_closes_session(self):
         """Test that close() properly closes the aiohttp session."""
@@ -116,6 +153,143 @@ class TestComfyUIClientSessionManagement:
         assert session.closed
 
 
+class TestComfyUIClientSharedSession:
+    """Test opt-in session sharing between ComfyUIClient instances."""
+
+    @pytest.mark.asyncio
+    async def test_clients_with_same_config_share_session(self):
+        """Test that share_session clients reuse one session per configuration."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188", share_session=True)
+
+        try:
+            async with ComfyUIClient(config) as client1:
+                session = client1.session
+            # Closing a sharing client leaves the session open for others
+            assert not session.closed
+
+            async with ComfyUIClient(config) as client2:
+                assert client2.session is session
+        finally:
+            await ComfyUIClient.close_all()
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_different_settings_get_separate_sessions(self):
+        """Test that clients only share sessions configured identically."""
+        config1 = ComfyUIConfig(url="http://127.0.0.1:8188", share_session=True)
+        config2 = ComfyUIConfig(
+            url="http://127.0.0.1:8188", timeout=30.0, share_session=True
+        )
+
+        try:
+            assert ComfyUIClient(config1).session is not ComfyUIClient(config2).session
+        finally:
+            await ComfyUIClient.close_all()
+
+    @pytest.mark.asyncio
+    async def test_shared_session_recreated_after_close_all(self):
+        """Test that a new shared session is created after close_all()."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188", share_session=True)
+        client = ComfyUIClient(config)
+
+        try:
+            first = client.session
+            await ComfyUIClient.close_all()
+            second = client.session
+
+            assert second is not first
+            assert not second.closed
+        finally:
+            await ComfyUIClient.close_all()
+
+    def test_shared_pools_released_when_loop_shuts_down(self):
+        """Test that asyncio.run() leaves no shared session cached or open."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188", share_session=True)
+        sessions: list[ClientSession] = []
+
+        async def use_shared_session() -> None:
+            sessions.append(ComfyUIClient(config).session)
+
+        asyncio.run(use_shared_session())
+        asyncio.run(use_shared_session())
+
+        assert sessions[0] is not sessions[1]
+        assert all(session.closed for session in sessions)
+        assert all(session.connector is None for session in sessions)
+        assert len(ComfyUIClient._shared_pools) == 0
+
+    def test_close_all_leaves_other_loops_alone(self):
+        """Test that close_all() only closes the running loop's pools."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188", share_session=True)
+
+        async def get_session() -> ClientSession:
+            return ComfyUIClient(config).session
+
+        async def close_all_elsewhere() -> ClientSession:
+            session = ComfyUIClient(config).session
+            await ComfyUIClient.close_all()
+            return session
+
+        other_loop = asyncio.new_event_loop()
+        try:
+            other_session = other_loop.run_until_complete(get_session())
+            session = asyncio.run(close_all_elsewhere())
+
+            assert session.closed
+            assert not other_session.closed
+            assert other_loop in ComfyUIClient._shared_pools
+        finally:
+            other_loop.run_until_complete(other_loop.shutdown_asyncgens())
+            other_loop.close()
+
+        assert other_session.closed
+        assert len(ComfyUIClient._shared_pools) == 0
+
+    @pytest.mark.asyncio
+    async def test_sessions_for_same_server_share_connector(self):
+        """Test that per-tenant sessions share one pool and close_all closes it."""
+        tenant1 = ComfyUIConfig(
+            url="http://127.0.0.1:8188", api_key="tenant-1", share_session=True
+        )
+        tenant2 = ComfyUIConfig(
+            url="http://127.0.0.1:8188", api_key="tenant-2", share_session=True
+        )
+        other_server = ComfyUIConfig(url="http://127.0.0.1:9999", share_session=True)
+
+        try:
+            session1 = ComfyUIClient(tenant1).session
+            session2 = ComfyUIClient(tenant2).session
+
+            assert session1 is not session2
+            assert session1.connector is session2.connector
+            assert ComfyUIClient(other_server).session.connector is not (
+                session1.connector
+            )
+
+            # Sessions do not own the shared pool
+            connector = session2.connector
+            await session1.close()
+            assert not connector.closed
+        finally:
+            await ComfyUIClient.close_all()
+
+        assert connector.closed
+
+    @pytest.mark.asyncio
+    async def test_unshared_clients_unaffected(self):
+        """Test that the default configuration still creates a session per client."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client1 = ComfyUIClient(config)
+        client2 = ComfyUIClient(config)
+
+        assert client1.session is not client2.session
+
+        # Clean up
+        await client1.close()
+        await client2.close()
+
+
 class TestComfyUIClientContextManager:
     """Test ComfyUIClient async context manager support."""
 
@@ -200,6 +374,105 @@ class TestComfyUIClientSessionConfiguration:
         # Clean up
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_session_user_agent_header(self):
+        """Test that the session identifies the client in its User-Agent."""
+        from comfyui_mcp import __version__
+
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client = ComfyUIClient(config)
+
+        session = client.session
+        assert session.headers["User-Agent"] == f"comfyui-mcp/{__version__}"
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_timeout_instance(self):
+        """Test that clients with the same timeout reuse one ClientTimeout."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188", timeout=45.0)
+        client1 = ComfyUIClient(config)
+        client2 = ComfyUIClient(config)
+
+        assert client1.session.timeout is client2.session.timeout
+        assert client1.session.timeout.total == 45.0
+
+        # Clean up
+        await client1.close()
+        await client2.close()
+
+    @pytest.mark.asyncio
+    async def test_session_headers_built_once(self):
+        """Test that recreated sessions reuse the client's read-only headers."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188", api_key="test-api-key-123")
+        client = ComfyUIClient(config)
+
+        first = client.session
+        await client.close()
+        client._session = None
+        second = client.session
+
+        assert second is not first
+        assert second.headers["Authorization"] == "Bearer test-api-key-123"
+        with pytest.raises(TypeError):
+            client._headers["Authorization"] = "Bearer other"  # type: ignore[index]
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_session_connector_defaults(self):
+        """Test that the session pools connections without aiohttp's 100 cap."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client = ComfyUIClient(config)
+
+        connector = client.session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 0
+        assert connector.limit_per_host == 0
+        assert not connector.force_close
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_session_connector_no_cleanup_warning_on_fixed_python(self):
+        """Test that enable_cleanup_closed is not passed where aiohttp warns."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client = ComfyUIClient(config)
+
+        with (
+            patch("comfyui_mcp.comfyui_client._NEEDS_CLEANUP_CLOSED", False),
+            patch("aiohttp.connector.NEEDS_CLEANUP_CLOSED", False, create=True),
+            warnings.catch_warnings(),
+        ):
+            warnings.simplefilter("error", DeprecationWarning)
+            connector = client.session.connector
+
+        assert isinstance(connector, TCPConnector)
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_session_connector_uses_config_limits(self):
+        """Test that connector limits come from the config."""
+        config = ComfyUIConfig(
+            url="http://127.0.0.1:8188",
+            connection_limit=200,
+            per_host_limit=50,
+            keepalive_timeout=30.0,
+        )
+        client = ComfyUIClient(config)
+
+        connector = client.session.connector
+        assert connector.limit == 200
+        assert connector.limit_per_host == 50
+
+        # Clean up
+        await client.close()
+
 
 class TestComfyUIClientIntegration:
     """Integration tests for ComfyUIClient."""
@@ -328,6 +601,103 @@ class TestComfyUIClientConnectionValidation:
         # Clean up
         await comfy_client.close()
 
+    @pytest.mark.asyncio
+    async def test_validate_connection_uses_head(self, aiohttp_server):
+        """Test that validation sends HEAD so no queue body is transferred."""
+        from aiohttp import web
+
+        methods: list[str] = []
+
+        async def queue_handler(request):
+            methods.append(request.method)
+            return web.json_response({"queue_running": [], "queue_pending": []})
+
+        app = web.Application()
+        app.router.add_get("/queue", queue_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+
+        async with ComfyUIClient(config) as comfy_client:
+            assert await comfy_client.validate_connection() is True
+
+        assert methods == ["HEAD"]
+
+    @pytest.mark.asyncio
+    async def test_validate_connection_falls_back_to_get(self, aiohttp_server):
+        """Test that a server rejecting HEAD with 405 is validated with GET."""
+        from aiohttp import web
+
+        methods: list[str] = []
+
+        async def queue_handler(request):
+            methods.append(request.method)
+            return web.json_response({"queue_running": [], "queue_pending": []})
+
+        app = web.Application()
+        app.router.add_get("/queue", queue_handler, allow_head=False)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+
+        async with ComfyUIClient(config) as comfy_client:
+            assert await comfy_client.validate_connection() is True
+
+        assert methods == ["GET"]
+
+    @pytest.mark.asyncio
+    async def test_validate_connection_propagates_unexpected_errors(self):
+        """Test that non-network errors are not reported as a failed connection."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client = ComfyUIClient(config)
+
+        with (
+            patch.object(client.session, "head", side_effect=RuntimeError("bug")),
+            pytest.raises(RuntimeError, match="bug"),
+        ):
+            await client.validate_connection()
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_error_status(self, aiohttp_server):
+        """Test that an error status is reported rather than raised."""
+        from aiohttp import web
+
+        async def queue_handler(request):
+            return web.Response(status=503, text="Service Unavailable")
+
+        app = web.Application()
+        app.router.add_get("/queue", queue_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        health_info = await client.health_check()
+
+        assert health_info["connected"] is False
+        assert health_info["status_code"] == 503
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_timeout(self):
+        """Test that a timeout is reported in the health check result."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client = ComfyUIClient(config)
+
+        with patch.object(client.session, "get", side_effect=asyncio.TimeoutError()):
+            health_info = await client.health_check()
+
+        assert health_info["connected"] is False
+        assert health_info["error"] == "Request timed out"
+
+        # Clean up
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_health_check_returns_server_info(self, aiohttp_server):
         """Test health check returns server information."""
@@ -650,6 +1020,37 @@ class TestComfyUIClientWorkflowSubmission:
         # Clean up
         await comfy_client.close()
 
+    @pytest.mark.asyncio
+    async def test_submit_workflow_sends_json_content_type(self, aiohttp_server):
+        """Test that the pre-serialized body is sent as application/json."""
+        from aiohttp import web
+
+        content_type = None
+
+        async def prompt_handler(request):
+            nonlocal content_type
+            content_type = request.content_type
+            await request.json()
+            return web.json_response({"prompt_id": "typed-123"})
+
+        app = web.Application()
+        app.router.add_post("/prompt", prompt_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        comfy_client = ComfyUIClient(config)
+
+        workflow = WorkflowPrompt(
+            nodes={"1": WorkflowNode(class_type="KSampler", inputs={"seed": 1})}
+        )
+        response = await comfy_client.submit_workflow(workflow)
+
+        assert content_type == "application/json"
+        assert response["prompt_id"] == "typed-123"
+
+        # Clean up
+        await comfy_client.close()
+
 
 class TestComfyUIClientQueueStatus:
     """Test ComfyUI client queue status monitoring."""
@@ -722,6 +1123,32 @@ class TestComfyUIClientQueueStatus:
         # Clean up
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_queue_status_comfyui_entry_layout(self, aiohttp_server):
+        """Test entries in ComfyUI's [number, prompt_id, prompt, ...] layout."""
+        from aiohttp import web
+
+        async def queue_handler(request):
+            return web.json_response(
+                {
+                    "queue_running": [[1, "prompt-111", {}, {}, ["9"]]],
+                    "queue_pending": [[2, "prompt-222", {}, {}, ["9"]]],
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/queue", queue_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+
+        async with ComfyUIClient(config) as client:
+            statuses = await client.get_queue_statuses(["prompt-111", "prompt-222"])
+
+        assert statuses["prompt-111"].state == WorkflowState.RUNNING
+        assert statuses["prompt-222"].state == WorkflowState.QUEUED
+        assert statuses["prompt-222"].queue_position == 0
+
     @pytest.mark.asyncio
     async def test_get_queue_status_first_in_queue(self, aiohttp_server):
         """Test get_queue_status when workflow is first in pending queue."""
@@ -854,40 +1281,135 @@ class TestComfyUIClientQueueStatus:
         # Clean up
         await client.close()
 
-
-class TestComfyUIClientHistory:
-    """Test ComfyUI client history retrieval for execution results."""
-
     @pytest.mark.asyncio
-    async def test_get_history_success(self, aiohttp_server):
-        """Test successful history retrieval with generated images."""
+    async def test_get_queue_status_conditional_polling(self, aiohttp_server):
+        """Test that /queue is revalidated with If-None-Match when it has an ETag."""
         from aiohttp import web
 
-        async def history_handler(request):
-            prompt_id = request.match_info["prompt_id"]
-            return web.json_response(
-                {
-                    prompt_id: {
-                        "outputs": {
-                            "9": {
-                                "images": [
-                                    {
-                                        "filename": "ComfyUI_00001_.png",
-                                        "subfolder": "",
-                                        "type": "output",
-                                    }
-                                ]
-                            }
-                        },
-                        "status": {"completed": True},
-                    }
-                }
-            )
+        etag = '"v1"'
+        queue = {"queue_running": [], "queue_pending": [["prompt-123", 1]]}
+        received_etags = []
+
+        async def queue_handler(request):
+            received_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            return web.json_response(queue, headers={"ETag": etag})
 
         app = web.Application()
-        app.router.add_get("/history/{prompt_id}", history_handler)
+        app.router.add_get("/queue", queue_handler)
 
-        # Start server
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        first = await client.get_queue_status("prompt-123")
+        second = await client.get_queue_status("prompt-123")
+
+        assert received_etags == [None, etag]
+        assert first.state == second.state == WorkflowState.QUEUED
+        assert second.queue_position == 0
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_queue_status_without_etag_not_conditional(self, aiohttp_server):
+        """Test that polling without server ETags always fetches the full queue."""
+        from aiohttp import web
+
+        received_etags = []
+
+        async def queue_handler(request):
+            received_etags.append(request.headers.get("If-None-Match"))
+            return web.json_response({"queue_running": [], "queue_pending": []})
+
+        app = web.Application()
+        app.router.add_get("/queue", queue_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        await client.get_queue_status("prompt-123")
+        await client.get_queue_status("prompt-123")
+
+        assert received_etags == [None, None]
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_queue_statuses_single_request(self, aiohttp_server):
+        """Test that get_queue_statuses resolves every ID from one /queue fetch."""
+        from aiohttp import web
+
+        request_count = 0
+
+        async def queue_handler(request):
+            nonlocal request_count
+            request_count += 1
+            return web.json_response(
+                {
+                    "queue_running": [["prompt-run", 1]],
+                    "queue_pending": [["prompt-a", 2], ["prompt-b", 3]],
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/queue", queue_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        statuses = await client.get_queue_statuses(
+            ["prompt-run", "prompt-b", "prompt-done"]
+        )
+
+        assert request_count == 1
+        assert statuses["prompt-run"].state == WorkflowState.RUNNING
+        assert statuses["prompt-b"].state == WorkflowState.QUEUED
+        assert statuses["prompt-b"].queue_position == 1
+        assert statuses["prompt-done"].state == WorkflowState.COMPLETED
+
+        # Clean up
+        await client.close()
+
+
+class TestComfyUIClientHistory:
+    """Test ComfyUI client history retrieval for execution results."""
+
+    @pytest.mark.asyncio
+    async def test_get_history_success(self, aiohttp_server):
+        """Test successful history retrieval with generated images."""
+        from aiohttp import web
+
+        async def history_handler(request):
+            prompt_id = request.match_info["prompt_id"]
+            return web.json_response(
+                {
+                    prompt_id: {
+                        "outputs": {
+                            "9": {
+                                "images": [
+                                    {
+                                        "filename": "ComfyUI_00001_.png",
+                                        "subfolder": "",
+                                        "type": "output",
+                                    }
+                                ]
+                            }
+                        },
+                        "status": {"completed": True},
+                    }
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/history/{prompt_id}", history_handler)
+
+        # Start server
         server = await aiohttp_server(app)
         config = ComfyUIConfig(url=str(server.make_url("/")))
         client = ComfyUIClient(config)
@@ -945,6 +1467,44 @@ class TestComfyUIClientHistory:
         # Clean up
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_history_skips_images_without_filename(self, aiohttp_server):
+        """Test that image entries with an empty filename are ignored."""
+        from aiohttp import web
+
+        async def history_handler(request):
+            prompt_id = request.match_info["prompt_id"]
+            return web.json_response(
+                {
+                    prompt_id: {
+                        "outputs": {
+                            "9": {
+                                "images": [
+                                    {"filename": "", "subfolder": "2024-01"},
+                                    {"subfolder": "2024-01"},
+                                    {"filename": "image_002.png", "subfolder": ""},
+                                ]
+                            },
+                            "10": {"text": ["not an image node"]},
+                        }
+                    }
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/history/{prompt_id}", history_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        result = await client.get_history("prompt-789")
+
+        assert result.images == ["image_002.png"]
+
+        # Clean up
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_get_history_multiple_images(self, aiohttp_server):
         """Test history retrieval with multiple generated images."""
@@ -1010,6 +1570,32 @@ class TestComfyUIClientHistory:
         # Clean up
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_history_empty_response_skips_decoding(self, aiohttp_server):
+        """Test that an empty {} history is recognized without JSON decoding."""
+        from aiohttp import web
+
+        async def history_handler(request):
+            return web.Response(body=b"{}", content_type="application/json")
+
+        app = web.Application()
+        app.router.add_get("/history/{prompt_id}", history_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        with (
+            patch("comfyui_mcp.comfyui_client._json.loads") as mock_loads,
+            pytest.raises(ValueError, match="not found in history"),
+        ):
+            await client.get_history("prompt-pending")
+
+        mock_loads.assert_not_called()
+
+        # Clean up
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_get_history_no_outputs(self, aiohttp_server):
         """Test history retrieval when workflow has no outputs."""
@@ -1118,6 +1704,203 @@ class TestComfyUIClientHistory:
         await client.close()
 
 
+class TestComfyUIClientHistories:
+    """Test batched history retrieval with get_histories()."""
+
+    @pytest.mark.asyncio
+    async def test_get_histories_single_request(self, aiohttp_server):
+        """Test that finished prompts are resolved from one /history fetch."""
+        from aiohttp import web
+
+        request_count = 0
+
+        async def history_handler(request):
+            nonlocal request_count
+            request_count += 1
+            return web.json_response(
+                {
+                    "prompt-a": {"outputs": {"9": {"images": [{"filename": "a.png"}]}}},
+                    "prompt-b": {
+                        "outputs": {
+                            "9": {
+                                "images": [
+                                    {"filename": "b.png", "subfolder": "2024-01"}
+                                ]
+                            }
+                        }
+                    },
+                    "prompt-running": {"outputs": {}},
+                    "prompt-other": {
+                        "outputs": {"9": {"images": [{"filename": "x.png"}]}}
+                    },
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/history", history_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        results = await client.get_histories(
+            ["prompt-a", "prompt-b", "prompt-running", "prompt-unknown"]
+        )
+
+        assert request_count == 1
+        assert set(results) == {"prompt-a", "prompt-b"}
+        assert results["prompt-a"].images == ["a.png"]
+        assert results["prompt-b"].images == ["2024-01/b.png"]
+        assert results["prompt-b"].prompt_id == "prompt-b"
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_histories_server_error(self, aiohttp_server):
+        """Test that get_histories raises on server errors."""
+        from aiohttp import web
+
+        async def history_handler(request):
+            return web.Response(status=404, text="Not Found")
+
+        app = web.Application()
+        app.router.add_get("/history", history_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        with pytest.raises(ClientResponseError):
+            await client.get_histories(["prompt-a"])
+
+        # Clean up
+        await client.close()
+
+
+class TestComfyUIClientWaitForResult:
+    """Test waiting for a workflow result by polling the history."""
+
+    @staticmethod
+    async def _history_server(
+        aiohttp_server, pending_polls: int, calls: list[str], *, queued: bool = True
+    ):
+        """Serve a history that is empty for the first pending_polls requests.
+
+        Until the prompt is in the history it is reported as running by
+        /queue, unless queued is False.
+        """
+        from aiohttp import web
+
+        running: list[str] = []
+
+        async def history_handler(request):
+            prompt_id = request.match_info["prompt_id"]
+            calls.append(prompt_id)
+            if len(calls) <= pending_polls:
+                running[:] = [prompt_id] if queued else []
+                return web.json_response({})
+            running.clear()
+            return web.json_response(
+                {
+                    prompt_id: {
+                        "outputs": {
+                            "9": {"images": [{"filename": "out.png", "subfolder": ""}]}
+                        }
+                    }
+                }
+            )
+
+        async def queue_handler(request):
+            return web.json_response(
+                {
+                    "queue_running": [[7, prompt_id, {}] for prompt_id in running],
+                    "queue_pending": [],
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/history/{prompt_id}", history_handler)
+        app.router.add_get("/queue", queue_handler)
+        return await aiohttp_server(app)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_result_polls_until_finished(self, aiohttp_server):
+        """Test that the history is polled until the prompt appears."""
+        calls: list[str] = []
+        server = await self._history_server(aiohttp_server, 3, calls)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+
+        async with ComfyUIClient(config) as client:
+            with patch(
+                "comfyui_mcp.comfyui_client.asyncio.sleep", wraps=asyncio.sleep
+            ) as mock_sleep:
+                result = await client.wait_for_result(
+                    "prompt-1", poll_interval=0.01, max_poll_interval=0.03
+                )
+
+        assert result.images == ["out.png"]
+        assert result.prompt_id == "prompt-1"
+        assert calls == ["prompt-1"] * 4
+        # Delays double from poll_interval up to max_poll_interval
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.01, 0.02, 0.03]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_result_returns_immediately_when_finished(
+        self, aiohttp_server
+    ):
+        """Test that a finished prompt is returned by the first poll."""
+        calls: list[str] = []
+        server = await self._history_server(aiohttp_server, 0, calls)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+
+        async with ComfyUIClient(config) as client:
+            result = await client.wait_for_result("prompt-2")
+
+        assert result.images == ["out.png"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_result_timeout(self, aiohttp_server):
+        """Test that waiting gives up after the timeout."""
+        calls: list[str] = []
+        server = await self._history_server(aiohttp_server, 1000, calls)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+
+        async with ComfyUIClient(config) as client:
+            with pytest.raises(asyncio.TimeoutError):
+                await client.wait_for_result(
+                    "prompt-3", poll_interval=0.01, timeout=0.1
+                )
+
+    @pytest.mark.asyncio
+    async def test_wait_for_result_fails_for_prompt_removed_from_queue(
+        self, aiohttp_server
+    ):
+        """Test that a prompt that will never reach the history fails fast."""
+        calls: list[str] = []
+        server = await self._history_server(aiohttp_server, 1000, calls, queued=False)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+
+        async with ComfyUIClient(config) as client:
+            with pytest.raises(ValueError, match="no longer queued"):
+                await client.wait_for_result(
+                    "prompt-5", poll_interval=0.01, max_poll_interval=0.04
+                )
+
+        # The queue is first consulted on the miss after the delay reaches
+        # max_poll_interval (third poll), then the history is re-checked once
+        assert calls == ["prompt-5"] * 4
+
+    @pytest.mark.asyncio
+    async def test_wait_for_result_rejects_non_positive_interval(self):
+        """Test that poll intervals must be positive."""
+        client = ComfyUIClient(ComfyUIConfig(url="http://127.0.0.1:8188"))
+
+        with pytest.raises(ValueError, match="must be positive"):
+            await client.wait_for_result("prompt-4", poll_interval=0)
+
+
 class TestComfyUIClientImageDownload:
     """Test ComfyUI client image download functionality."""
 
@@ -1327,6 +2110,132 @@ class TestComfyUIClientImageDownload:
         # Clean up
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_download_image_to_streams_file(self, aiohttp_server, tmp_path):
+        """Test that download_image_to writes the image to the destination."""
+        from aiohttp import web
+
+        large_image_data = b"\x89PNG" + (b"\x01" * (512 * 1024))
+
+        async def view_handler(request):
+            return web.Response(body=large_image_data, content_type="image/png")
+
+        app = web.Application()
+        app.router.add_get("/view", view_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        destination = tmp_path / "image.png"
+        written = await client.download_image_to(destination, "image.png")
+
+        assert written == len(large_image_data)
+        assert destination.read_bytes() == large_image_data
+        assert list(tmp_path.iterdir()) == [destination]
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_download_image_to_error_keeps_existing_file(
+        self, aiohttp_server, tmp_path
+    ):
+        """Test that a failed download leaves the destination untouched."""
+        from aiohttp import web
+
+        async def view_handler(request):
+            return web.Response(status=404, text="File not found")
+
+        app = web.Application()
+        app.router.add_get("/view", view_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        destination = tmp_path / "image.png"
+        destination.write_bytes(b"old")
+
+        with pytest.raises(ClientResponseError):
+            await client.download_image_to(destination, "missing.png")
+
+        assert destination.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [destination]
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_download_images_preserves_order(self, aiohttp_server):
+        """Test that download_images returns bytes in the order requested."""
+        from aiohttp import web
+
+        async def view_handler(request):
+            return web.Response(
+                body=request.query["filename"].encode(), content_type="image/png"
+            )
+
+        app = web.Application()
+        app.router.add_get("/view", view_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        images = await client.download_images(
+            [(f"{i}.png", "", "output") for i in range(10)], concurrency=3
+        )
+
+        assert images == [f"{i}.png".encode() for i in range(10)]
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_download_images_bounds_concurrency(self, aiohttp_server):
+        """Test that no more than `concurrency` downloads run at once."""
+        from aiohttp import web
+
+        in_flight = 0
+        peak = 0
+
+        async def view_handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return web.Response(body=b"img", content_type="image/png")
+
+        app = web.Application()
+        app.router.add_get("/view", view_handler)
+
+        server = await aiohttp_server(app)
+        config = ComfyUIConfig(url=str(server.make_url("/")))
+        client = ComfyUIClient(config)
+
+        await client.download_images(
+            [(f"{i}.png", "", "output") for i in range(8)], concurrency=2
+        )
+
+        assert peak == 2
+
+        # Clean up
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_download_images_rejects_zero_concurrency(self):
+        """Test that a concurrency below 1 raises ValueError."""
+        config = ComfyUIConfig(url="http://127.0.0.1:8188")
+        client = ComfyUIClient(config)
+
+        with pytest.raises(ValueError, match="concurrency"):
+            await client.download_images([("a.png", "", "output")], concurrency=0)
+
+        # Clean up
+        await client.close()
+
 
 class TestComfyUIClientWorkflowCancellation:
     """Test ComfyUI client workflow cancellation functionality."""
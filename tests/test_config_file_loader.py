@@ -16,7 +16,14 @@ import pytest
 from pydantic import ValidationError
 
 from comfyui_mcp import ComfyUIConfig
-from comfyui_mcp.config import find_config_file, load_config
+from comfyui_mcp.config import (
+    CONFIG_CACHE_FILENAME,
+    clear_config_file_cache,
+    default_config,
+    find_config_file,
+    get_cache_dir,
+    load_config,
+)
 
 
 class TestFindConfigFile:
@@ -38,6 +45,19 @@ class TestFindConfigFile:
         assert found is not None
         assert found.resolve() == config_file.resolve()
 
+    def test_find_config_skips_directory_with_config_name(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a directory named like the config file is not returned."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path / "fake_home"))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path / "fake_home"))
+        (tmp_path / "comfyui.toml").mkdir()
+
+        found = find_config_file()
+
+        assert found is None or found.parent != tmp_path
+
     def test_find_config_in_user_config_dir(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -278,6 +298,32 @@ url = "http://localhost:8188/"
         config = ComfyUIConfig.from_file(config_file)
         assert config.url == "http://localhost:8188"
 
+    def test_from_file_reuses_result_for_unchanged_file(self, tmp_path: Path) -> None:
+        """Test that an unchanged file is not parsed again."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[comfyui]\nurl = "http://localhost:8188"\n')
+
+        first = ComfyUIConfig.from_file(config_file)
+        second = ComfyUIConfig.from_file(str(config_file))
+
+        assert second is first
+
+    def test_from_file_rereads_modified_file(self, tmp_path: Path) -> None:
+        """Test that editing the file invalidates the reused result."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[comfyui]\nurl = "http://localhost:8188"\n')
+        first = ComfyUIConfig.from_file(config_file)
+
+        config_file.write_text('[comfyui]\nurl = "http://localhost:9999"\n')
+        stat = config_file.stat()
+        # Make sure the modification time moves even on coarse-grained clocks
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = ComfyUIConfig.from_file(config_file)
+
+        assert second is not first
+        assert second.url == "http://localhost:9999"
+
 
 class TestLoadConfig:
     """Tests for load_config() convenience function."""
@@ -394,6 +440,256 @@ output_dir = "./file_output"
         assert config.api_key is None
         assert config.output_dir is None
 
+    def test_load_config_reads_connection_pool_settings(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that connection pool settings are read from the config file."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("COMFYUI_URL", raising=False)
+        (tmp_path / "comfyui.toml").write_text(
+            """
+[comfyui]
+url = "http://file:8188"
+connection_limit = 64
+per_host_limit = 16
+keepalive_timeout = 30.0
+"""
+        )
+
+        config = load_config()
+
+        assert config.connection_limit == 64
+        assert config.per_host_limit == 16
+        assert config.keepalive_timeout == 30.0
+
+    def test_load_config_ignores_invalid_timeout_in_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unparsable file timeout only drops that one field."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("COMFYUI_URL", raising=False)
+        monkeypatch.delenv("COMFYUI_TIMEOUT", raising=False)
+        monkeypatch.delenv("COMFYUI_OUTPUT_DIR", raising=False)
+        (tmp_path / "comfyui.toml").write_text(
+            """
+[comfyui]
+url = "http://file:8188"
+timeout = "soon"
+output_dir = "/tmp/out"
+"""
+        )
+
+        config = load_config()
+
+        assert config.url == "http://file:8188"
+        assert config.timeout == 120.0  # Default
+        assert config.output_dir == "/tmp/out"
+
+    def test_load_config_ignores_non_table_comfyui_key(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a "comfyui" key that is not a table is ignored."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("COMFYUI_URL", "http://env:8188")
+        monkeypatch.delenv("COMFYUI_TIMEOUT", raising=False)
+        (tmp_path / "comfyui.toml").write_text('comfyui = "x"\n')
+
+        config = load_config()
+
+        assert config.url == "http://env:8188"
+        assert config.timeout == 120.0  # Default
+
+
+class TestFindConfigFileMemoization:
+    """Tests for memoized config file discovery."""
+
+    @pytest.fixture
+    def work_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Switch to an empty working directory with no user config."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        monkeypatch.chdir(work_dir)
+        monkeypatch.setenv("HOME", str(tmp_path / "fake_home"))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path / "fake_home"))
+        return work_dir
+
+    def test_lookup_is_memoized(self, work_dir: Path) -> None:
+        """Test that a repeated lookup does not re-check the filesystem."""
+        assert find_config_file() is None
+
+        (work_dir / "comfyui.toml").write_text('[comfyui]\nurl = "http://a:1"\n')
+
+        assert find_config_file() is None
+
+    def test_clear_cache_picks_up_new_file(self, work_dir: Path) -> None:
+        """Test that clear_config_file_cache() forces a fresh search."""
+        assert find_config_file() is None
+
+        config_file = work_dir / "comfyui.toml"
+        config_file.write_text('[comfyui]\nurl = "http://a:1"\n')
+        clear_config_file_cache()
+
+        assert find_config_file() == config_file
+
+    def test_lookup_keyed_by_working_directory(
+        self, work_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that changing directory triggers a new search."""
+        assert find_config_file() is None
+
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        config_file = other_dir / "comfyui.toml"
+        config_file.write_text('[comfyui]\nurl = "http://a:1"\n')
+        monkeypatch.chdir(other_dir)
+
+        assert find_config_file() == config_file
+
+
+class TestDefaultConfig:
+    """Tests for the shared fallback configuration."""
+
+    def test_default_config_points_at_local_server(self) -> None:
+        """Test that the fallback configuration targets localhost:8188."""
+        config = default_config()
+
+        assert config.url == "http://localhost:8188"
+        assert config.timeout == 120.0
+        assert config.api_key is None
+
+    def test_default_config_is_shared(self) -> None:
+        """Test that every call returns the same frozen instance."""
+        assert default_config() is default_config()
+
+
+class TestConfigCache:
+    """Tests for the on-disk cache used by load_config(use_cache=True)."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Create a config file in a clean working directory."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        monkeypatch.chdir(work_dir)
+        monkeypatch.setenv("HOME", str(tmp_path / "fake_home"))
+        for name in (
+            "COMFYUI_URL",
+            "COMFYUI_API_KEY",
+            "COMFYUI_TIMEOUT",
+            "COMFYUI_OUTPUT_DIR",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        config_file = work_dir / "comfyui.toml"
+        config_file.write_text('[comfyui]\nurl = "http://file:8188"\n')
+        return config_file
+
+    def test_get_cache_dir_uses_xdg_cache_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the cache directory lives under XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert get_cache_dir() == tmp_path / "comfyui-mcp"
+
+    def test_get_cache_dir_defaults_to_home_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the cache directory falls back to ~/.cache."""
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+        assert get_cache_dir() == tmp_path / ".cache" / "comfyui-mcp"
+
+    def test_cache_not_written_by_default(self, config_file: Path) -> None:
+        """Test that load_config() leaves the cache alone unless asked."""
+        load_config()
+
+        assert not (get_cache_dir() / CONFIG_CACHE_FILENAME).exists()
+
+    def test_no_home_needed_without_cache(
+        self, config_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that load_config() works when no home directory can be found."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+        def no_home() -> Path:
+            msg = "Could not determine home directory."
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr(Path, "home", staticmethod(no_home))
+
+        assert load_config().url == "http://file:8188"
+
+    def test_cache_written_and_reused(self, config_file: Path) -> None:
+        """Test that a cached configuration is returned on the next call."""
+        first = load_config(use_cache=True)
+        cache_file = get_cache_dir() / CONFIG_CACHE_FILENAME
+
+        assert cache_file.exists()
+
+        # Replace the cached URL to prove the second call reads the cache
+        cached = cache_file.read_text().replace(
+            "http://file:8188", "http://cached:8188"
+        )
+        cache_file.write_text(cached)
+
+        second = load_config(use_cache=True)
+        assert first.url == "http://file:8188"
+        assert second.url == "http://cached:8188"
+
+    def test_cache_invalidated_when_file_changes(self, config_file: Path) -> None:
+        """Test that editing the config file invalidates the cache."""
+        load_config(use_cache=True)
+
+        config_file.write_text('[comfyui]\nurl = "http://edited-host:8188"\n')
+
+        assert load_config(use_cache=True).url == "http://edited-host:8188"
+
+    def test_cache_invalidated_when_env_changes(
+        self, config_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that changing COMFYUI_* variables invalidates the cache."""
+        load_config(use_cache=True)
+
+        monkeypatch.setenv("COMFYUI_URL", "http://env:8188")
+
+        assert load_config(use_cache=True).url == "http://env:8188"
+
+    def test_cache_invalidated_when_version_changes(
+        self, config_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cache written by another package version is not reused."""
+        load_config(use_cache=True)
+        cache_file = get_cache_dir() / CONFIG_CACHE_FILENAME
+        cache_file.write_text(
+            cache_file.read_text().replace("http://file:8188", "http://cached:8188")
+        )
+
+        monkeypatch.setattr("comfyui_mcp.config.__version__", "999.0.0")
+
+        assert load_config(use_cache=True).url == "http://file:8188"
+
+    def test_corrupt_cache_is_ignored(self, config_file: Path) -> None:
+        """Test that an unreadable cache file falls back to loading."""
+        cache_file = get_cache_dir() / CONFIG_CACHE_FILENAME
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("not json")
+
+        config = load_config(use_cache=True)
+
+        assert config.url == "http://file:8188"
+        assert cache_file.read_text() != "not json"
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_cache_file_is_private(self, config_file: Path) -> None:
+        """Test that the cache file is only readable by its owner."""
+        load_config(use_cache=True)
+
+        mode = (get_cache_dir() / CONFIG_CACHE_FILENAME).stat().st_mode
+        assert mode & 0o077 == 0
+
 
 class TestConfigFileFormats:
     """Tests for various TOML file formats and edge cases."""
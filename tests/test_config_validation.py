@@ -76,6 +76,81 @@ class TestURLValidation:
             ComfyUIConfig(url="   ")
 
 
+class TestWithURL:
+    """Test replacing the URL of an existing configuration."""
+
+    def test_with_url_replaces_only_url(self) -> None:
+        """Test that with_url keeps every other field."""
+        config = ComfyUIConfig(
+            url="http://localhost:8188",
+            api_key="sk-test-key-12345",
+            timeout=60.0,
+            output_dir="/tmp/output",
+        )
+
+        updated = config.with_url("http://remote:9999")
+
+        assert updated.url == "http://remote:9999"
+        assert updated.api_key == "sk-test-key-12345"
+        assert updated.timeout == 60.0
+        assert updated.output_dir == "/tmp/output"
+
+    def test_with_url_leaves_original_unchanged(self) -> None:
+        """Test that with_url returns a new instance."""
+        config = ComfyUIConfig(url="http://localhost:8188")
+
+        updated = config.with_url("http://remote:9999")
+
+        assert updated is not config
+        assert config.url == "http://localhost:8188"
+
+    def test_with_url_normalizes_trailing_slash(self) -> None:
+        """Test that the new URL is normalized like a constructed one."""
+        config = ComfyUIConfig(url="http://localhost:8188")
+
+        assert config.with_url("http://remote:9999///").url == "http://remote:9999"
+
+    def test_with_url_rejects_invalid_url(self) -> None:
+        """Test that the new URL is validated."""
+        config = ComfyUIConfig(url="http://localhost:8188")
+
+        with pytest.raises(ValidationError):
+            config.with_url("not-a-valid-url")
+
+    def test_with_url_result_is_frozen(self) -> None:
+        """Test that the copy stays immutable."""
+        updated = ComfyUIConfig(url="http://localhost:8188").with_url("http://b:1")
+
+        with pytest.raises(ValidationError):
+            updated.url = "http://c:2"  # type: ignore[misc]
+
+
+class TestBaseURL:
+    """Test the parsed base_url property."""
+
+    def test_base_url_parses_url(self) -> None:
+        """Test that base_url is the parsed, normalized server URL."""
+        config = ComfyUIConfig(url="http://localhost:8188/comfy/")
+
+        assert str(config.base_url) == "http://localhost:8188/comfy"
+        assert config.base_url.port == 8188
+
+    def test_base_url_parsed_once_per_url(self) -> None:
+        """Test that configs with the same URL share one parsed URL."""
+        config1 = ComfyUIConfig(url="http://localhost:8188")
+        config2 = ComfyUIConfig(url="http://localhost:8188", timeout=30.0)
+
+        assert config1.base_url is config2.base_url
+
+    def test_base_url_follows_with_url(self) -> None:
+        """Test that a copy made with with_url() exposes the new URL."""
+        config = ComfyUIConfig(url="http://localhost:8188")
+        remote = config.with_url("http://192.168.1.100:8188")
+
+        assert config.base_url.host == "localhost"
+        assert remote.base_url.host == "192.168.1.100"
+
+
 class TestAPIKeyValidation:
     """Test API key validation."""
 
@@ -108,6 +183,11 @@ class TestAPIKeyValidation:
 
         assert "api_key" in str(exc_info.value).lower()
 
+    def test_api_key_long_whitespace_only_invalid(self) -> None:
+        """Test that whitespace-only API keys of valid length are rejected."""
+        with pytest.raises(ValidationError, match="whitespace-only"):
+            ComfyUIConfig(url="http://localhost:8188", api_key="\t" + " " * 10)
+
     def test_api_key_too_short_invalid(self) -> None:
         """Test that API key shorter than 8 characters is rejected."""
         with pytest.raises(ValidationError) as exc_info:
@@ -177,6 +257,29 @@ class TestTimeoutValidation:
             ComfyUIConfig(url="http://localhost:8188", timeout=999999.0)
 
 
+class TestConnectionPoolValidation:
+    """Test connection pool setting validation."""
+
+    def test_connection_pool_defaults(self) -> None:
+        """Test that pool limits default to unlimited, 60s keep-alive, unshared."""
+        config = ComfyUIConfig(url="http://localhost:8188")
+
+        assert config.connection_limit == 0
+        assert config.per_host_limit == 0
+        assert config.keepalive_timeout == 60.0
+        assert config.share_session is False
+
+    def test_negative_connection_limit_invalid(self) -> None:
+        """Test that a negative connection limit is rejected."""
+        with pytest.raises(ValidationError):
+            ComfyUIConfig(url="http://localhost:8188", connection_limit=-1)
+
+    def test_non_positive_keepalive_timeout_invalid(self) -> None:
+        """Test that a zero keep-alive timeout is rejected."""
+        with pytest.raises(ValidationError):
+            ComfyUIConfig(url="http://localhost:8188", keepalive_timeout=0.0)
+
+
 class TestOutputDirectoryValidation:
     """Test output directory validation."""
 
@@ -32,6 +32,14 @@ class TestComfyUIError:
             raise ComfyUIError("test error")
         assert str(exc_info.value) == "test error"
 
+    def test_context_kwargs_go_through_exception_descriptors(self):
+        """Test that context named like BaseException attributes sets them."""
+        cause = OSError("connection reset")
+        error = ComfyUIError("test", __cause__=cause)
+
+        assert error.__cause__ is cause
+        assert "__cause__" not in vars(error)
+
 
 class TestComfyUIConnectionError:
     """Test connection error exception."""
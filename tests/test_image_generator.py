@@ -10,7 +10,9 @@ Tests the image generation orchestration system including:
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
@@ -20,11 +22,14 @@ from comfyui_mcp import (
     ComfyUIConfig,
     GenerationResult,
     WorkflowNode,
+    WorkflowPrompt,
+    WorkflowState,
+    WorkflowStatus,
     WorkflowTemplate,
     WorkflowTemplateManager,
 )
 from comfyui_mcp.exceptions import ComfyUIError
-from comfyui_mcp.image_generator import ImageGenerator
+from comfyui_mcp.image_generator import DEFAULT_RESULT_TIMEOUT, ImageGenerator
 from comfyui_mcp.models import TemplateParameter
 
 
@@ -96,7 +101,7 @@ class TestImageGeneratorGeneration:
             )
         )
         client.submit_workflow = submit_mock  # type: ignore[method-assign]
-        client.get_history = history_mock  # type: ignore[method-assign]
+        client.wait_for_result = history_mock  # type: ignore[method-assign]
 
         generator = ImageGenerator(client=client, template_manager=manager)
 
@@ -112,7 +117,9 @@ class TestImageGeneratorGeneration:
 
         # Verify client methods were called
         submit_mock.assert_called_once()
-        history_mock.assert_called_once_with("test-prompt-123")
+        history_mock.assert_called_once_with(
+            "test-prompt-123", timeout=DEFAULT_RESULT_TIMEOUT
+        )
 
     @pytest.mark.asyncio
     async def test_generate_from_template_missing_template(
@@ -190,7 +197,7 @@ class TestImageGeneratorDirectWorkflow:
             )
         )
         client.submit_workflow = submit_mock  # type: ignore[method-assign]
-        client.get_history = history_mock  # type: ignore[method-assign]
+        client.wait_for_result = history_mock  # type: ignore[method-assign]
 
         generator = ImageGenerator(client=client)
 
@@ -210,7 +217,9 @@ class TestImageGeneratorDirectWorkflow:
         assert result.images == ["direct_output.png"]
 
         submit_mock.assert_called_once_with(workflow)
-        history_mock.assert_called_once_with("test-prompt-456")
+        history_mock.assert_called_once_with(
+            "test-prompt-456", timeout=DEFAULT_RESULT_TIMEOUT
+        )
 
 
 class TestImageGeneratorErrorHandling:
@@ -237,7 +246,7 @@ class TestImageGeneratorErrorHandling:
         submit_mock = AsyncMock(return_value={"prompt_id": "test-prompt-789"})
         history_mock = AsyncMock(side_effect=ComfyUIError("History failed"))
         client.submit_workflow = submit_mock  # type: ignore[method-assign]
-        client.get_history = history_mock  # type: ignore[method-assign]
+        client.wait_for_result = history_mock  # type: ignore[method-assign]
 
         generator = ImageGenerator(client=client, template_manager=manager)
 
@@ -299,7 +308,7 @@ class TestImageGeneratorIntegration:
             )
         )
         client.submit_workflow = submit_mock  # type: ignore[method-assign]
-        client.get_history = history_mock  # type: ignore[method-assign]
+        client.wait_for_result = history_mock  # type: ignore[method-assign]
 
         generator = ImageGenerator(client=client, template_manager=manager)
 
@@ -319,3 +328,203 @@ class TestImageGeneratorIntegration:
         submitted_workflow = submit_call[0][0]
         assert submitted_workflow.nodes["1"].inputs["text"] == "a mighty warrior"
         assert submitted_workflow.nodes["2"].inputs["seed"] == 12345
+
+
+def _slow_client(release: asyncio.Event, in_flight: list[int]) -> ComfyUIClient:
+    """Create a client whose generations block until release is set."""
+    client = ComfyUIClient(ComfyUIConfig(url="http://localhost:8188"))
+    active = 0
+
+    async def submit(workflow: Any) -> dict[str, str]:
+        nonlocal active
+        active += 1
+        in_flight.append(active)
+        await release.wait()
+        active -= 1
+        return {"prompt_id": "prompt"}
+
+    client.submit_workflow = submit  # type: ignore[method-assign]
+    client.wait_for_result = AsyncMock(  # type: ignore[method-assign]
+        return_value=GenerationResult(
+            prompt_id="prompt", images=["out.png"], execution_time=0.0
+        )
+    )
+    return client
+
+
+def _workflow() -> WorkflowPrompt:
+    """Create a minimal workflow prompt."""
+    return WorkflowPrompt(nodes={"1": WorkflowNode(class_type="Test", inputs={})})
+
+
+class TestImageGeneratorAdmissionControl:
+    """Tests for limiting concurrent generations with max_inflight."""
+
+    def test_max_inflight_defaults_to_unlimited(self) -> None:
+        """Test that generators admit every call unless a limit is given."""
+        client = ComfyUIClient(ComfyUIConfig(url="http://localhost:8188"))
+
+        assert ImageGenerator(client=client).max_inflight is None
+
+    def test_invalid_max_inflight_rejected(self) -> None:
+        """Test that a limit below 1 raises ValueError."""
+        client = ComfyUIClient(ComfyUIConfig(url="http://localhost:8188"))
+
+        with pytest.raises(ValueError, match="max_inflight"):
+            ImageGenerator(client=client, max_inflight=0)
+
+    @pytest.mark.asyncio
+    async def test_generate_respects_max_inflight(self) -> None:
+        """Test that no more than max_inflight generations run at once."""
+        release = asyncio.Event()
+        in_flight: list[int] = []
+        generator = ImageGenerator(
+            client=_slow_client(release, in_flight), max_inflight=2
+        )
+
+        tasks = [asyncio.create_task(generator.generate(_workflow())) for _ in range(5)]
+        await asyncio.sleep(0.01)
+
+        assert generator.inflight == 2
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert max(in_flight) == 2
+        assert len(results) == 5
+        assert generator.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_raising_max_inflight_admits_waiting_calls(self) -> None:
+        """Test that set_max_inflight wakes calls waiting for a slot."""
+        release = asyncio.Event()
+        in_flight: list[int] = []
+        generator = ImageGenerator(
+            client=_slow_client(release, in_flight), max_inflight=1
+        )
+
+        tasks = [asyncio.create_task(generator.generate(_workflow())) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert generator.inflight == 1
+
+        await generator.set_max_inflight(3)
+        await asyncio.sleep(0.01)
+        assert generator.inflight == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_slot_released_when_generation_fails(self) -> None:
+        """Test that a failing generation frees its admission slot."""
+        client = ComfyUIClient(ComfyUIConfig(url="http://localhost:8188"))
+        client.submit_workflow = AsyncMock(  # type: ignore[method-assign]
+            side_effect=ComfyUIError("boom")
+        )
+        generator = ImageGenerator(client=client, max_inflight=1)
+
+        with pytest.raises(ComfyUIError):
+            await generator.generate(_workflow())
+
+        assert generator.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_prompt_stuck_in_queue_times_out(self) -> None:
+        """Test that a prompt that never reaches the history times out."""
+        client = ComfyUIClient(ComfyUIConfig(url="http://localhost:8188"))
+        client.submit_workflow = AsyncMock(  # type: ignore[method-assign]
+            return_value={"prompt_id": "stuck"}
+        )
+        # Never in the history, and reported as running the whole time
+        client._fetch_history_entry = AsyncMock(  # type: ignore[method-assign]
+            return_value=None
+        )
+        client.get_queue_status = AsyncMock(  # type: ignore[method-assign]
+            return_value=WorkflowStatus(
+                state=WorkflowState.RUNNING, queue_position=None, progress=0.0
+            )
+        )
+        generator = ImageGenerator(client=client, max_inflight=1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await generator.generate(_workflow(), timeout=0.05)
+
+        assert generator.inflight == 0
+
+
+class TestImageGeneratorBatch:
+    """Tests for generating several workflows with generate_batch."""
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_limits_parallelism(self) -> None:
+        """Test that at most max_parallel generations of a batch run at once."""
+        release = asyncio.Event()
+        in_flight: list[int] = []
+        generator = ImageGenerator(client=_slow_client(release, in_flight))
+
+        batch = asyncio.create_task(
+            generator.generate_batch([_workflow() for _ in range(5)], max_parallel=2)
+        )
+        await asyncio.sleep(0.01)
+
+        assert generator.inflight == 2
+        release.set()
+        results = await batch
+
+        assert max(in_flight) == 2
+        assert [r.images for r in results] == [["out.png"]] * 5
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_preserves_order(self) -> None:
+        """Test that results are returned in workflow order."""
+        client = ComfyUIClient(ComfyUIConfig(url="http://localhost:8188"))
+        prompt_ids = iter(["p0", "p1", "p2"])
+
+        async def submit(workflow: Any) -> dict[str, str]:
+            return {"prompt_id": next(prompt_ids)}
+
+        async def wait_for_result(prompt_id: str, **kwargs: Any) -> GenerationResult:
+            # Finish later prompts first
+            await asyncio.sleep(0.01 * (3 - int(prompt_id[1])))
+            return GenerationResult(
+                prompt_id=prompt_id, images=[f"{prompt_id}.png"], execution_time=0.0
+            )
+
+        client.submit_workflow = submit  # type: ignore[method-assign]
+        client.wait_for_result = wait_for_result  # type: ignore[method-assign]
+        generator = ImageGenerator(client=client)
+
+        results = await generator.generate_batch([_workflow() for _ in range(3)])
+
+        assert [r.prompt_id for r in results] == ["p0", "p1", "p2"]
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_cancels_rest_on_failure(self) -> None:
+        """Test that one failing generation cancels the rest of the batch."""
+        release = asyncio.Event()
+        client = _slow_client(release, [])
+        submit = client.submit_workflow
+        calls = 0
+
+        async def submit_or_fail(workflow: Any) -> dict[str, str]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ComfyUIError("boom")
+            return await submit(workflow)
+
+        client.submit_workflow = submit_or_fail  # type: ignore[method-assign]
+        generator = ImageGenerator(client=client)
+
+        with pytest.raises(ComfyUIError, match="boom"):
+            await generator.generate_batch([_workflow() for _ in range(3)])
+
+        assert generator.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_rejects_invalid_max_parallel(self) -> None:
+        """Test that max_parallel below 1 raises ValueError."""
+        client = ComfyUIClient(ComfyUIConfig(url="http://localhost:8188"))
+        generator = ImageGenerator(client=client)
+
+        with pytest.raises(ValueError, match="max_parallel"):
+            await generator.generate_batch([_workflow()], max_parallel=0)
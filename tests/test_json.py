@@ -0,0 +1,91 @@
+"""Tests for the JSON helpers in comfyui_mcp._json.
+
+Tests both backends (orjson when installed, stdlib json otherwise) for:
+- Decoding bytes and str input
+- Compact and indented encoding
+- Error types for invalid input
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from comfyui_mcp import _json
+
+DOCUMENT: dict[str, Any] = {
+    "name": "Portrait",
+    "nodes": {"1": {"class_type": "KSampler", "inputs": {"seed": 42}}},
+    "tags": ["character", "café"],
+    "category": None,
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test against each available JSON backend."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return str(request.param)
+
+
+class TestLoads:
+    """Tests for _json.loads()."""
+
+    def test_loads_bytes(self, backend: str) -> None:
+        """Test that bytes input is decoded."""
+        assert _json.loads(json.dumps(DOCUMENT).encode()) == DOCUMENT
+
+    def test_loads_str(self, backend: str) -> None:
+        """Test that str input is decoded."""
+        assert _json.loads(json.dumps(DOCUMENT)) == DOCUMENT
+
+    def test_loads_invalid_raises_json_decode_error(self, backend: str) -> None:
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads(b"{not json")
+
+
+class TestDumps:
+    """Tests for _json.dumps()."""
+
+    def test_dumps_compact(self, backend: str) -> None:
+        """Test that default output has no whitespace between tokens."""
+        assert _json.dumps(["a", {"b": 1}]) == '["a",{"b":1}]'
+
+    def test_dumps_indented(self, backend: str) -> None:
+        """Test that indent=True matches json.dumps(indent=2)."""
+        expected = json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+
+        assert _json.dumps(DOCUMENT, indent=True) == expected
+
+    def test_dumps_round_trip(self, backend: str) -> None:
+        """Test that encoded output decodes to the original object."""
+        assert _json.loads(_json.dumps(DOCUMENT)) == DOCUMENT
+
+    def test_dumps_unserializable_raises_type_error(self, backend: str) -> None:
+        """Test that unsupported values raise TypeError."""
+        with pytest.raises(TypeError):
+            _json.dumps({"value": object()})
+
+
+class TestDumpsBytes:
+    """Tests for _json.dumps_bytes()."""
+
+    def test_dumps_bytes_compact_utf8(self, backend: str) -> None:
+        """Test that output is compact JSON encoded as UTF-8."""
+        assert _json.dumps_bytes({"tag": "café"}) == '{"tag":"café"}'.encode()
+
+    def test_dumps_bytes_indented(self, backend: str) -> None:
+        """Test that indent=True matches the UTF-8 encoded dumps() output."""
+        expected = _json.dumps(DOCUMENT, indent=True).encode()
+
+        assert _json.dumps_bytes(DOCUMENT, indent=True) == expected
+
+    def test_dumps_bytes_round_trip(self, backend: str) -> None:
+        """Test that encoded bytes decode back to the original document."""
+        assert _json.loads(_json.dumps_bytes(DOCUMENT)) == DOCUMENT
@@ -213,6 +213,23 @@ class TestWorkflowPrompt:
         assert "1" in api_format["prompt"]
         assert api_format["prompt"]["1"]["class_type"] == "Test"
 
+    @pytest.mark.parametrize("client_id", [None, "client-123"])
+    def test_workflow_to_api_bytes_matches_api_format(
+        self, client_id: str | None
+    ) -> None:
+        """Test that to_api_bytes encodes exactly the to_api_format document."""
+        from comfyui_mcp import _json
+
+        prompt = WorkflowPrompt(
+            nodes={
+                "1": WorkflowNode(class_type="Test", inputs={"param": "value"}),
+                "2": WorkflowNode(class_type="KSampler", inputs={"model": ["1", 0]}),
+            },
+            client_id=client_id,
+        )
+
+        assert prompt.to_api_bytes() == _json.dumps_bytes(prompt.to_api_format())
+
     def test_workflow_from_dict(self) -> None:
         """Test creating workflow from dictionary (parsing API response)."""
         data = {
@@ -0,0 +1,102 @@
+"""Tests for the comfyui_mcp package entry point.
+
+Tests the lazy attribute loading in comfyui_mcp/__init__.py including:
+- Cheap package import (no heavy submodules loaded eagerly)
+- Resolution of every public name on first access
+- Error handling for unknown attributes
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import comfyui_mcp
+
+
+class TestLazyImports:
+    """Tests for PEP 562 lazy loading of public names."""
+
+    def test_import_does_not_load_submodules(self) -> None:
+        """Test that importing the package leaves heavy submodules unloaded."""
+        code = (
+            "import sys, comfyui_mcp; "
+            "heavy = [m for m in ('comfyui_mcp.server', 'comfyui_mcp.comfyui_client', "
+            "'comfyui_mcp.cli', 'comfyui_mcp.models', 'aiohttp', 'mcp', 'click') "
+            "if m in sys.modules]; "
+            "print(','.join(heavy))"
+        )
+        src_dir = str(Path(comfyui_mcp.__file__).resolve().parent.parent)
+        env = {**os.environ, "PYTHONPATH": src_dir}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_version_available_without_lazy_load(self) -> None:
+        """Test that __version__ is a plain module constant."""
+        assert comfyui_mcp.__version__ == "0.1.0"
+
+    @pytest.mark.parametrize("name", comfyui_mcp.__all__)
+    def test_all_public_names_resolve(self, name: str) -> None:
+        """Test that every name in __all__ resolves to an object."""
+        assert getattr(comfyui_mcp, name) is not None
+
+    def test_lazy_name_matches_submodule_object(self) -> None:
+        """Test that lazily loaded names are the submodule's objects."""
+        from comfyui_mcp.comfyui_client import ComfyUIClient
+
+        assert comfyui_mcp.ComfyUIClient is ComfyUIClient
+
+    @pytest.mark.parametrize(
+        "first_access",
+        [
+            "comfyui_mcp.cli_main",
+            "import comfyui_mcp.cli",
+            "from comfyui_mcp.cli import main",
+        ],
+    )
+    def test_cli_is_group_in_any_import_order(self, first_access: str) -> None:
+        """Test that cli is the Click group even after the submodule loads."""
+        code = (
+            f"import comfyui_mcp; {first_access}; print(type(comfyui_mcp.cli).__name__)"
+        )
+        src_dir = str(Path(comfyui_mcp.__file__).resolve().parent.parent)
+        env = {**os.environ, "PYTHONPATH": src_dir}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+
+        assert result.stdout.strip() == "LazyGroup"
+
+    def test_cli_after_submodule_import(self) -> None:
+        """Test that cli resolves to the group once comfyui_mcp.cli is loaded."""
+        cli_module = importlib.import_module("comfyui_mcp.cli")
+
+        assert comfyui_mcp.cli is cli_module.cli
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'does_not_exist'"):
+            _ = comfyui_mcp.does_not_exist
+
+    def test_dir_includes_lazy_names(self) -> None:
+        """Test that dir() lists lazily exported names."""
+        names = dir(comfyui_mcp)
+
+        assert "ComfyUIClient" in names
+        assert "WorkflowTemplateManager" in names
@@ -493,6 +493,29 @@ class TestNestedStructureSubstitution:
         assert workflow.nodes["1"].inputs["objects"][0]["name"] == "dynamic"
         assert workflow.nodes["1"].inputs["objects"][1]["name"] == "static"
 
+    def test_instantiated_inputs_do_not_share_containers(self) -> None:
+        """Test that mutating an instantiated workflow leaves the template intact."""
+        template = WorkflowTemplate(
+            name="Test",
+            description="Test template",
+            parameters={},
+            nodes={
+                "1": WorkflowNode(
+                    class_type="Test",
+                    inputs={"model": ["4", 0], "options": {"mode": "fast"}},
+                )
+            },
+        )
+
+        workflow = template.instantiate()
+        workflow.nodes["1"].inputs["model"][0] = "9"
+        workflow.nodes["1"].inputs["options"]["mode"] = "slow"
+
+        assert template.nodes["1"].inputs == {
+            "model": ["4", 0],
+            "options": {"mode": "fast"},
+        }
+
 
 class TestPartialStringSubstitution:
     """Tests for partial string substitution (interpolation)."""
@@ -558,6 +581,35 @@ class TestPartialStringSubstitution:
 
         assert workflow.nodes["1"].inputs["text"] == "warrior, anime style"
 
+    def test_reflects_nodes_changed_between_instantiations(self) -> None:
+        """Test that editing a template's inputs is seen by the next instantiate."""
+        template = WorkflowTemplate(
+            name="Test",
+            description="Test template",
+            parameters={
+                "subject": TemplateParameter(
+                    name="subject",
+                    description="Subject",
+                    type="string",
+                    default="character",
+                    required=False,
+                )
+            },
+            nodes={
+                "1": WorkflowNode(
+                    class_type="CLIPTextEncode",
+                    inputs={"text": "{{subject}} {{missing}}"},
+                )
+            },
+        )
+
+        first = template.instantiate({"subject": "knight"})
+        template.nodes["1"].inputs["text"] = "portrait of {{subject}}"
+        second = template.instantiate({"subject": "knight"})
+
+        assert first.nodes["1"].inputs["text"] == "knight {{missing}}"
+        assert second.nodes["1"].inputs["text"] == "portrait of knight"
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -15,7 +15,7 @@ from pathlib import Path
 import pytest
 
 from comfyui_mcp import TemplateParameter, WorkflowNode, WorkflowTemplate
-from comfyui_mcp.template_manager import WorkflowTemplateManager
+from comfyui_mcp.template_manager import TemplateSummary, WorkflowTemplateManager
 
 
 class TestWorkflowTemplateManagerInitialization:
@@ -368,6 +368,127 @@ class TestWorkflowTemplateManagerListByCategory:
         assert "no-category" in none_templates
 
 
+class TestWorkflowTemplateManagerSummaries:
+    """Tests for template summaries and the on-disk summary index."""
+
+    @pytest.fixture
+    def template_dir(self, tmp_path: Path) -> Path:
+        """Create a directory with two templates."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        WorkflowTemplate(
+            name="Character",
+            description="Character template",
+            category="character",
+            parameters={
+                "prompt": TemplateParameter(
+                    name="prompt", description="Prompt", type="string", default=""
+                )
+            },
+            nodes={},
+        ).to_file(template_dir / "character.json")
+        WorkflowTemplate(
+            name="Item",
+            description="Item template",
+            parameters={},
+            nodes={},
+        ).to_file(template_dir / "item.json")
+        return template_dir
+
+    def test_summaries_without_cache_dir(self, template_dir: Path) -> None:
+        """Test that summaries describe each template, sorted by ID."""
+        manager = WorkflowTemplateManager(template_dir)
+
+        assert manager.get_template_summaries() == [
+            TemplateSummary(
+                "character", "Character", "Character template", "character", 1
+            ),
+            TemplateSummary("item", "Item", "Item template", None, 0),
+        ]
+
+    def test_index_written_to_cache_dir(
+        self, template_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that an index file is written when cache_dir is set."""
+        cache_dir = tmp_path / "cache"
+        manager = WorkflowTemplateManager(template_dir, cache_dir=cache_dir)
+
+        manager.get_template_summaries()
+
+        assert len(list(cache_dir.glob("templates-*.idx.json"))) == 1
+
+    def test_warm_index_skips_template_parsing(
+        self, template_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a valid index is used without loading templates."""
+        cache_dir = tmp_path / "cache"
+        expected = WorkflowTemplateManager(
+            template_dir, cache_dir=cache_dir
+        ).get_template_summaries()
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("template file was parsed")
+
+        monkeypatch.setattr(WorkflowTemplate, "from_file", fail)
+        manager = WorkflowTemplateManager(template_dir, cache_dir=cache_dir)
+
+        assert manager.get_template_summaries() == expected
+
+    def test_index_invalidated_when_template_changes(
+        self, template_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that modifying a template file rebuilds the index."""
+        cache_dir = tmp_path / "cache"
+        WorkflowTemplateManager(
+            template_dir, cache_dir=cache_dir
+        ).get_template_summaries()
+
+        WorkflowTemplate(
+            name="Renamed Item",
+            description="Item template",
+            parameters={},
+            nodes={},
+        ).to_file(template_dir / "item.json")
+
+        summaries = WorkflowTemplateManager(
+            template_dir, cache_dir=cache_dir
+        ).get_template_summaries()
+        assert summaries[1].name == "Renamed Item"
+
+    def test_index_invalidated_when_template_added(
+        self, template_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that adding a template file rebuilds the index."""
+        cache_dir = tmp_path / "cache"
+        WorkflowTemplateManager(
+            template_dir, cache_dir=cache_dir
+        ).get_template_summaries()
+
+        WorkflowTemplate(
+            name="Env", description="Env template", parameters={}, nodes={}
+        ).to_file(template_dir / "env.json")
+
+        summaries = WorkflowTemplateManager(
+            template_dir, cache_dir=cache_dir
+        ).get_template_summaries()
+        assert [s.template_id for s in summaries] == ["character", "env", "item"]
+
+    def test_corrupt_index_is_rebuilt(self, template_dir: Path, tmp_path: Path) -> None:
+        """Test that an unreadable index file is ignored and replaced."""
+        cache_dir = tmp_path / "cache"
+        manager = WorkflowTemplateManager(template_dir, cache_dir=cache_dir)
+        manager.get_template_summaries()
+        (index_file,) = cache_dir.glob("templates-*.idx.json")
+        index_file.write_text("{not json")
+
+        summaries = WorkflowTemplateManager(
+            template_dir, cache_dir=cache_dir
+        ).get_template_summaries()
+
+        assert [s.template_id for s in summaries] == ["character", "item"]
+        assert index_file.read_text() != "{not json"
+
+
 class TestWorkflowTemplateManagerReload:
     """Tests for reloading templates."""
 
@@ -157,6 +157,24 @@ class TestWorkflowTemplateToFile:
         assert "old" not in data
         assert data["name"] == "New Template"
 
+    def test_to_file_writes_utf8(self, tmp_path: Path) -> None:
+        """Test that non-ASCII text is written as UTF-8 and reads back intact."""
+        output_file = tmp_path / "unicode.json"
+        template = WorkflowTemplate(
+            name="Café",
+            description="Portrait of a 戦士",
+            parameters={},
+            nodes={
+                "1": WorkflowNode(class_type="CLIPTextEncode", inputs={"text": "é"})
+            },
+        )
+
+        template.to_file(output_file)
+
+        data = json.loads(output_file.read_bytes().decode("utf-8"))
+        assert data["description"] == "Portrait of a 戦士"
+        assert WorkflowTemplate.from_file(output_file) == template
+
 
 class TestWorkflowTemplateFromFile:
     """Tests for WorkflowTemplate.from_file() classmethod."""
@@ -196,6 +214,38 @@ class TestWorkflowTemplateFromFile:
         assert len(template.nodes) == 1
         assert "1" in template.nodes
 
+    def test_from_file_ignores_unknown_keys_and_defaults_sections(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that extra top-level keys are ignored and sections default empty."""
+        template_file = tmp_path / "minimal.json"
+        template_file.write_text(
+            json.dumps({"name": "Minimal", "description": "No nodes", "version": 2})
+        )
+
+        template = WorkflowTemplate.from_file(template_file)
+
+        assert template.name == "Minimal"
+        assert template.parameters == {}
+        assert template.nodes == {}
+
+    def test_from_file_validates_nested_nodes(self, tmp_path: Path) -> None:
+        """Test that malformed nodes are rejected with a ValidationError."""
+        template_file = tmp_path / "bad-node.json"
+        template_file.write_text(
+            json.dumps(
+                {
+                    "name": "Bad",
+                    "description": "Node without class_type",
+                    "parameters": {},
+                    "nodes": {"1": {"inputs": {}}},
+                }
+            )
+        )
+
+        with pytest.raises(ValidationError):
+            WorkflowTemplate.from_file(template_file)
+
     def test_from_file_raises_on_missing_file(self, tmp_path: Path) -> None:
         """Test that from_file raises FileNotFoundError for missing files."""
         missing_file = tmp_path / "nonexistent.json"
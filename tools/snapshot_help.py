@@ -0,0 +1,31 @@
+"""Regenerate the pre-rendered ``comfyui-mcp --help`` text.
+
+The console entry point prints ``src/comfyui_mcp/_help_cache.txt`` for a
+bare ``comfyui-mcp --help`` instead of importing Click. Run this script
+after changing the CLI's options, commands or help text; the test suite
+fails while the file is out of date.
+
+Usage:
+    python tools/snapshot_help.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from comfyui_mcp.cli import HELP_CACHE_FILENAME, render_help  # noqa: E402
+
+
+def main() -> None:
+    """Write the rendered help text next to the comfyui_mcp sources."""
+    target = SRC_DIR / "comfyui_mcp" / HELP_CACHE_FILENAME
+    target.write_text(render_help(), encoding="utf-8")
+    print(f"Wrote {target}")
+
+
+if __name__ == "__main__":
+    main()